@@ -1,7 +1,7 @@
 """AI provider abstractions for agentic-spec."""
 
-from .base import AIProvider
+from .base import AIProvider, AIProviderBase
 from .factory import AIProviderFactory
 from .openai_provider import OpenAIProvider
 
-__all__ = ["AIProvider", "AIProviderFactory", "OpenAIProvider"]
+__all__ = ["AIProvider", "AIProviderBase", "AIProviderFactory", "OpenAIProvider"]
@@ -1,34 +1,72 @@
-"""Abstract base class for AI service providers."""
+"""Interface and shared base class for AI service providers."""
 
-from abc import ABC, abstractmethod
-from typing import Any
+import asyncio
+from collections.abc import AsyncIterator, Coroutine, Sequence
+from typing import Any, Protocol
 
+from ..utils.event_loop import run_async
 
-class AIProvider(ABC):
-    """Abstract base class for AI service providers.
 
-    This class defines the interface that all AI providers must implement
-    to be compatible with the agentic-spec system.
+def run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Unlike ``asyncio.run``, this reuses the process-wide event loop of
+    ``run_async`` instead of creating and tearing down a loop for every call.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        RuntimeError: If called while an event loop is running in this thread
     """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return run_async(coro)
+    coro.close()
+    msg = "run_sync cannot be called from a running event loop"
+    raise RuntimeError(msg)
 
-    def __init__(self, config: dict[str, Any]):
-        """Initialize the AI provider with configuration.
+
+class AIProvider(Protocol):
+    """Interface for AI service providers.
+
+    This protocol defines the interface that all AI providers must implement
+    to be compatible with the agentic-spec system. Providers usually inherit
+    the shared plumbing in ``AIProviderBase``.
+    """
+
+    config: dict[str, Any]
+
+    @classmethod
+    def build_client(cls, config: dict[str, Any]) -> Any | None:
+        """Build an API client that can be shared between provider instances.
 
         Args:
-            config: Provider-specific configuration including API keys, endpoints, etc.
+            config: Provider-specific configuration
+
+        Returns:
+            A client instance, or None if the provider has no poolable client
         """
-        self.config = config
-        self._validate_config()
+        ...
 
-    @abstractmethod
-    def _validate_config(self) -> None:
+    @classmethod
+    def validate_config(cls, config: dict[str, Any]) -> None:
         """Validate the provider-specific configuration.
 
+        Called by the factory before a provider or its client is constructed.
+
+        Args:
+            config: Provider-specific configuration
+
         Raises:
             ValueError: If the configuration is invalid or missing required fields.
         """
+        ...
 
-    @abstractmethod
     async def generate_response(
         self,
         prompt: str,
@@ -52,37 +90,173 @@ class AIProvider(ABC):
         Raises:
             AIServiceError: If the AI service request fails
         """
+        ...
+
+    def generate_response_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        model: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a response from the AI provider as it is generated.
+
+        Args:
+            prompt: The user prompt to send to the AI
+            system_prompt: Optional system prompt to guide the AI behavior
+            temperature: Sampling temperature (0.0 to 1.0)
+            model: Model name to use (provider-specific)
+
+        Yields:
+            Successive chunks of the response text
+
+        Raises:
+            AIServiceError: If the AI service request fails
+        """
+        ...
+
+    async def generate_responses_batch(
+        self,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        model: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> list[str | Exception]:
+        """Generate responses for several prompts sharing the same settings.
+
+        Args:
+            prompts: The user prompts to send to the AI
+            system_prompt: Optional system prompt applied to every prompt
+            temperature: Sampling temperature (0.0 to 1.0)
+            model: Model name to use (provider-specific)
+            tools: Optional tools/functions available to the AI
+
+        Returns:
+            One entry per prompt, in order: the response text, or the
+            exception raised for that prompt
+        """
+        ...
 
-    @abstractmethod
     def get_default_model(self) -> str:
         """Get the default model name for this provider.
 
         Returns:
             The default model identifier
         """
+        ...
 
-    @abstractmethod
-    def get_available_models(self) -> list[str]:
-        """Get list of available models for this provider.
+    def get_available_models(self) -> Sequence[str]:
+        """Get the available models for this provider.
 
         Returns:
-            List of model identifiers
+            Sequence of model identifiers
         """
+        ...
 
     @property
-    @abstractmethod
     def provider_name(self) -> str:
         """Get the name of this AI provider.
 
         Returns:
             Human-readable provider name
         """
+        ...
 
     @property
-    @abstractmethod
     def is_available(self) -> bool:
         """Check if this provider is available and properly configured.
 
         Returns:
             True if the provider can be used, False otherwise
         """
+        ...
+
+
+class AIProviderBase:
+    """Shared configuration handling and fallbacks for AI providers.
+
+    Subclasses implement the remaining ``AIProvider`` methods and override
+    ``validate_config`` to check their settings.
+    """
+
+    __slots__ = ("config",)
+
+    def __init__(self, config: dict[str, Any]):
+        """Initialize the AI provider with configuration.
+
+        Args:
+            config: Provider-specific configuration including API keys, endpoints,
+                etc. It is validated by ``AIProviderFactory.create_provider``
+                before construction, not here.
+        """
+        self.config = config
+
+    @classmethod
+    def build_client(cls, config: dict[str, Any]) -> Any | None:  # noqa: ARG003
+        """Return None; providers with a poolable API client override this."""
+        return None
+
+    @classmethod
+    def validate_config(cls, config: dict[str, Any]) -> None:
+        """Accept any configuration; providers with requirements override this."""
+
+    def generate_response_sync(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        model: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> str:
+        """Blocking wrapper around ``generate_response`` for synchronous callers.
+
+        Requests run on a shared event loop, so repeated calls do not pay
+        for creating a new loop each time.
+        """
+        return run_sync(
+            self.generate_response(
+                prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                model=model,
+                tools=tools,
+            )
+        )
+
+    async def generate_response_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        model: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield the complete ``generate_response`` result as a single chunk."""
+        yield await self.generate_response(
+            prompt, system_prompt=system_prompt, temperature=temperature, model=model
+        )
+
+    async def generate_responses_batch(
+        self,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        model: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> list[str | Exception]:
+        """Call ``generate_response`` for each prompt in turn."""
+        results: list[str | Exception] = []
+        for prompt in prompts:
+            try:
+                results.append(
+                    await self.generate_response(
+                        prompt,
+                        system_prompt=system_prompt,
+                        temperature=temperature,
+                        model=model,
+                        tools=tools,
+                    )
+                )
+            except Exception as e:
+                results.append(e)
+        return results
@@ -0,0 +1,65 @@
+"""In-memory response cache for AI providers."""
+
+from collections import OrderedDict
+import hashlib
+import json
+import time
+from typing import Any
+
+
+class ResponseCache:
+    """LRU cache with per-entry expiry for AI responses.
+
+    Entries are evicted least-recently-used once ``maxsize`` is reached and
+    treated as missing once they are older than ``ttl_s`` seconds.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_s: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: str | None,
+        prompt: str,
+        temperature: float,
+        tools: list[dict[str, Any]] | None,
+    ) -> str:
+        """Build a cache key from the request parameters."""
+        payload = json.dumps(
+            [model, system_prompt, prompt, temperature, tools], sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_s, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,5 +1,8 @@
 """Factory for creating AI provider instances."""
 
+import asyncio
+from typing import Any, ClassVar
+
 from ..config import AIProviderConfig
 from ..exceptions import ConfigurationError
 from .base import AIProvider
@@ -9,10 +12,16 @@ from .openai_provider import OpenAIProvider
 class AIProviderFactory:
     """Factory for creating AI provider instances."""
 
-    _providers = {
+    _providers: ClassVar[dict[str, type[AIProvider]]] = {
         "openai": OpenAIProvider,
     }
 
+    # Shared API clients keyed by provider type and connection settings, so
+    # repeated provider construction reuses warm connection pools. A client's
+    # connections belong to the event loop it first ran on, so there is one
+    # pool per running loop.
+    _client_pools: ClassVar[dict[asyncio.AbstractEventLoop, dict[tuple, Any]]] = {}
+
     @classmethod
     def create_provider(cls, provider_config: AIProviderConfig) -> AIProvider:
         """Create an AI provider instance from configuration.
@@ -26,26 +35,69 @@ class AIProviderFactory:
         Raises:
             ConfigurationError: If provider type is unknown or configuration is invalid
         """
-        provider_type = provider_config.provider_type.lower()
+        # provider_type is normalized to lowercase by AIProviderConfig
+        provider_type = provider_config.provider_type
 
-        if provider_type not in cls._providers:
+        provider_class = cls._providers.get(provider_type)
+        if provider_class is None:
             available = ", ".join(cls._providers.keys())
-            raise ConfigurationError(
+            msg = (
                 f"Unknown AI provider type: {provider_type}. "
                 f"Available providers: {available}"
             )
-
-        provider_class = cls._providers[provider_type]
+            raise ConfigurationError(msg)
 
         # Convert pydantic model to dict for provider
         config_dict = provider_config.model_dump()
 
+        # Validate up front so neither the client nor the provider is built
+        # from a bad configuration
         try:
+            provider_class.validate_config(config_dict)
+        except ValueError as e:
+            msg = f"Failed to create {provider_type} provider: {e}"
+            raise ConfigurationError(msg) from e
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to pool for: the provider builds and owns its client
             return provider_class(config_dict)
-        except Exception as e:
-            raise ConfigurationError(
-                f"Failed to create {provider_type} provider: {e}"
-            ) from e
+
+        client_pool = cls._client_pool_for(loop)
+        client_key = (
+            provider_type,
+            config_dict.get("api_key"),
+            config_dict.get("base_url"),
+            config_dict.get("timeout"),
+            config_dict.get("max_retries"),
+            config_dict.get("max_connections"),
+        )
+        client = client_pool.get(client_key)
+        if client is None:
+            client = provider_class.build_client(config_dict)
+            if client is None:
+                return provider_class(config_dict)
+            client_pool[client_key] = client
+        return provider_class(config_dict, client=client)
+
+    @classmethod
+    def _client_pool_for(cls, loop: asyncio.AbstractEventLoop) -> dict[tuple, Any]:
+        """Return the client pool of ``loop``, dropping pools of closed loops."""
+        for closed in [other for other in cls._client_pools if other.is_closed()]:
+            del cls._client_pools[closed]
+        return cls._client_pools.setdefault(loop, {})
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close the API clients pooled for the running loop and empty the pool.
+
+        Call this before the loop is closed, e.g. at the end of the coroutine
+        passed to ``asyncio.run``.
+        """
+        clients = cls._client_pools.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.close()
 
     @classmethod
     def get_available_providers(cls) -> list[str]:
@@ -64,6 +116,6 @@ class AIProviderFactory:
 
         Args:
             provider_type: Name of the provider type
-            provider_class: Provider class that inherits from AIProvider
+            provider_class: Provider class implementing the AIProvider protocol
         """
         cls._providers[provider_type.lower()] = provider_class
@@ -1,50 +1,185 @@
 """OpenAI AI provider implementation."""
 
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+import contextlib
+import functools
+import hashlib
+import logging
 import os
-from typing import Any
+import time
+from typing import Any, ClassVar
 
 from ..exceptions import AIServiceError
-from .base import AIProvider
+from .base import AIProviderBase
+from .cache import ResponseCache
 
-try:
-    from openai import AsyncOpenAI
+logger = logging.getLogger(__name__)
 
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+_OPENAI_MODELS = (
+    "gpt-4.1",
+    "gpt-4o",
+    "gpt-4o-mini",
+    "gpt-4-turbo",
+)
 
 
-class OpenAIProvider(AIProvider):
+# The openai SDK (and httpx beneath it) is expensive to import, so it is
+# loaded on first use rather than when agentic_spec is imported
+@functools.cache
+def _load_openai() -> Any | None:
+    """Import the openai module, or return None if not installed."""
+    try:
+        import openai
+    except ImportError:
+        return None
+    return openai
+
+
+@functools.cache
+def _load_opentelemetry() -> Any | None:
+    """Import the OpenTelemetry tracing API if it is installed."""
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+    return trace
+
+
+def _build_messages(prompt: str, system_prompt: str | None) -> list[dict[str, str]]:
+    """Build the chat message list for a prompt and optional system prompt."""
+    if system_prompt:
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+    return [{"role": "user", "content": prompt}]
+
+
+@functools.lru_cache(maxsize=128)
+def _prompt_cache_key(system_prompt: str) -> str:
+    """Derive the prompt cache key for a system prompt.
+
+    System prompts are several kilobytes and usually identical across a
+    batch, so the digest is memoized rather than recomputed per request.
+    """
+    return hashlib.blake2b(system_prompt.encode(), digest_size=16).hexdigest()
+
+
+def _prompt_cache_params(system_prompt: str | None) -> dict[str, str]:
+    """Build request parameters that route a system prompt to OpenAI's cache.
+
+    Requests sharing a system prompt get the same ``prompt_cache_key`` so
+    OpenAI can serve their common prefix from its prompt cache.
+    """
+    if not system_prompt:
+        return {}
+    return {"prompt_cache_key": _prompt_cache_key(system_prompt)}
+
+
+def _build_http_client(config: dict[str, Any]) -> Any | None:
+    """Build an aiohttp-backed HTTP client for AsyncOpenAI.
+
+    The default httpx transport degrades under high request concurrency, so
+    the aiohttp transport is preferred when the ``openai[aiohttp]`` extra is
+    installed. Returns None to fall back to the SDK default otherwise.
+    """
+    import httpx
+
+    openai = _load_openai()
+    max_connections = config.get("max_connections", 100)
+    try:
+        return openai.DefaultAioHttpClient(
+            timeout=config.get("timeout", 120.0),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+    except RuntimeError:
+        # aiohttp extra not installed
+        return None
+
+
+class OpenAIProvider(AIProviderBase):
     """OpenAI AI provider implementation."""
 
-    def __init__(self, config: dict[str, Any]):
+    __slots__ = (
+        "_cache",
+        "_default_model",
+        "_is_available",
+        "_latencies",
+        "_owns_client",
+        "_semaphore",
+        "_telemetry_enabled",
+        "client",
+    )
+
+    # Prompt-cache usage across all OpenAI providers in this process
+    _usage_totals: ClassVar[dict[str, int]] = {
+        "requests": 0,
+        "prompt_tokens": 0,
+        "cached_tokens": 0,
+    }
+
+    def __init__(self, config: dict[str, Any], client: Any | None = None):
         """Initialize OpenAI provider.
 
         Args:
             config: Configuration including api_key, base_url, etc.
+            client: Optional pre-built AsyncOpenAI client to share; the
+                provider does not close clients it did not create
         """
         super().__init__(config)
-        if OPENAI_AVAILABLE:
-            self.client = AsyncOpenAI(
-                api_key=self.config.get("api_key"),
-                base_url=self.config.get("base_url"),
-                timeout=self.config.get("timeout", 120.0),
-            )
-        else:
-            self.client = None
+        self._default_model = self.config.get("default_model") or "gpt-4o-mini"
+        # The SDK and API key are checked once here; neither changes while
+        # the process runs, so is_available does not re-read the environment
+        self._is_available = _load_openai() is not None and bool(
+            self.config.get("api_key") or os.getenv("OPENAI_API_KEY")
+        )
+        self._owns_client = client is None
+        self.client = client if client is not None else self.build_client(config)
+        self._cache = ResponseCache(
+            maxsize=self.config.get("cache_maxsize", 1024),
+            ttl_s=self.config.get("cache_ttl_s", 3600.0),
+        )
+        # Created on first use so it is bound to the loop making requests
+        self._semaphore: asyncio.Semaphore | None = None
+        self._telemetry_enabled = bool(self.config.get("enable_telemetry"))
+        self._latencies: deque[float] = deque(maxlen=1024)
 
-    def _validate_config(self) -> None:
+    @classmethod
+    def build_client(cls, config: dict[str, Any]) -> Any | None:
+        """Build an AsyncOpenAI client from configuration."""
+        openai = _load_openai()
+        if openai is None:
+            return None
+        return openai.AsyncOpenAI(
+            api_key=config.get("api_key"),
+            base_url=config.get("base_url"),
+            timeout=config.get("timeout", 120.0),
+            # The SDK retries connection errors, timeouts, 429 and 5xx
+            # responses with jittered exponential backoff; auth and
+            # bad-request errors are raised immediately
+            max_retries=config.get("max_retries", 3),
+            http_client=_build_http_client(config),
+        )
+
+    @classmethod
+    def validate_config(cls, config: dict[str, Any]) -> None:
         """Validate OpenAI configuration."""
-        if not OPENAI_AVAILABLE:
-            raise ValueError(
-                "OpenAI library not available. Install with: pip install openai"
-            )
+        if _load_openai() is None:
+            msg = "OpenAI library not available. Install with: pip install openai"
+            raise ValueError(msg)
 
-        api_key = self.config.get("api_key") or os.getenv("OPENAI_API_KEY")
+        api_key = config.get("api_key") or os.getenv("OPENAI_API_KEY")
         if not api_key:
-            raise ValueError(
-                "OpenAI API key not provided in config or OPENAI_API_KEY environment variable"
+            msg = (
+                "OpenAI API key not provided in config or OPENAI_API_KEY "
+                "environment variable"
             )
+            raise ValueError(msg)
 
     async def generate_response(
         self,
@@ -56,48 +191,248 @@ class OpenAIProvider(AIProvider):
     ) -> str:
         """Generate response using OpenAI API."""
         if not self.client:
-            raise AIServiceError("OpenAI client not available")
+            msg = "OpenAI client not available"
+            raise AIServiceError(msg)
+
+        model = model or self.get_default_model()
+
+        # Only deterministic requests are cached; sampled output should vary
+        cache_key = None
+        if temperature == 0.0:
+            cache_key = ResponseCache.make_key(
+                model, system_prompt, prompt, temperature, tools
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        async with self._get_semaphore():
+            if self._telemetry_enabled:
+                result = await self._create_response_traced(
+                    prompt, system_prompt, temperature, model, tools
+                )
+            else:
+                result = await self._create_response(
+                    prompt, system_prompt, temperature, model, tools
+                )
+        if cache_key is not None:
+            self._cache.set(cache_key, result)
+        return result
+
+    def _record_usage(self, usage: Any, tokens_field: str, details_field: str) -> None:
+        """Accumulate prompt-cache usage reported by the API.
+
+        The Responses and Chat Completions APIs name their usage fields
+        differently, so the field names are passed in by the caller.
+        """
+        prompt_tokens = getattr(usage, tokens_field, None)
+        if not isinstance(prompt_tokens, int):
+            return
+        cached_tokens = getattr(
+            getattr(usage, details_field, None), "cached_tokens", None
+        )
+        if not isinstance(cached_tokens, int):
+            cached_tokens = 0
+
+        self._usage_totals["requests"] += 1
+        self._usage_totals["prompt_tokens"] += prompt_tokens
+        self._usage_totals["cached_tokens"] += cached_tokens
+        logger.debug(
+            "OpenAI prompt cache: %d of %d prompt tokens cached",
+            cached_tokens,
+            prompt_tokens,
+        )
+
+        if self._telemetry_enabled and (trace := _load_opentelemetry()):
+            trace.get_current_span().set_attributes(
+                {"prompt_tokens": prompt_tokens, "cached_tokens": cached_tokens}
+            )
+
+    @classmethod
+    def cache_stats(cls) -> dict[str, int]:
+        """Get OpenAI prompt-cache usage accumulated by this process.
+
+        Returns:
+            Counts of requests, prompt tokens sent and prompt tokens served
+            from OpenAI's prompt cache
+        """
+        return dict(cls._usage_totals)
+
+    def recent_latencies_ms(self) -> list[float]:
+        """Get the durations of recent API requests in milliseconds.
+
+        Only populated when ``enable_telemetry`` is set in the provider
+        config; holds the most recent 1024 requests, oldest first.
+        """
+        return list(self._latencies)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent requests to the API.
+
+        Single, batched and streamed requests share this limit, which is
+        set by the ``max_concurrency`` config value.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(
+                self.config.get("max_concurrency") or 16
+            )
+        return self._semaphore
 
+    async def _create_response_traced(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        model: str,
+        tools: list[dict[str, Any]] | None,
+    ) -> str:
+        """Issue a request while recording its latency and a tracing span.
+
+        A span is only emitted when OpenTelemetry is installed.
+        """
+        trace = _load_opentelemetry()
+        span = (
+            trace.get_tracer(__name__).start_as_current_span(
+                "openai.generate_response",
+                attributes={"model": model, "temperature": temperature},
+            )
+            if trace
+            else contextlib.nullcontext()
+        )
+        start = time.perf_counter_ns()
         try:
-            model = model or self.get_default_model()
+            with span:
+                return await self._create_response(
+                    prompt, system_prompt, temperature, model, tools
+                )
+        finally:
+            self._latencies.append((time.perf_counter_ns() - start) / 1_000_000)
 
+    async def _create_response(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        model: str,
+        tools: list[dict[str, Any]] | None,
+    ) -> str:
+        """Issue a single request to the OpenAI API."""
+        request = _prompt_cache_params(system_prompt)
+        try:
             # Check if this is a Responses API call (with tools)
             if tools:
+                # The system prompt stays a separate leading message so it
+                # forms a stable prefix for OpenAI's automatic prompt caching
                 response = await self.client.responses.create(
                     model=model,
                     tools=tools,
-                    input=f"{system_prompt}\n\n{prompt}" if system_prompt else prompt,
+                    input=_build_messages(prompt, system_prompt),
                     temperature=temperature,
+                    **request,
+                )
+                self._record_usage(
+                    getattr(response, "usage", None),
+                    "input_tokens",
+                    "input_tokens_details",
                 )
                 return response.output_text
             # Standard chat completion
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-
             response = await self.client.chat.completions.create(
                 model=model,
-                messages=messages,
+                messages=_build_messages(prompt, system_prompt),
                 temperature=temperature,
+                **request,
+            )
+            self._record_usage(
+                getattr(response, "usage", None),
+                "prompt_tokens",
+                "prompt_tokens_details",
             )
             return response.choices[0].message.content or ""
 
         except Exception as e:
-            raise AIServiceError(f"OpenAI API error: {e}") from e
+            msg = f"OpenAI API error: {e}"
+            raise AIServiceError(msg) from e
+
+    async def generate_response_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        model: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion from the OpenAI API chunk by chunk."""
+        if not self.client:
+            msg = "OpenAI client not available"
+            raise AIServiceError(msg)
+
+        async with self._get_semaphore():
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=model or self.get_default_model(),
+                    messages=_build_messages(prompt, system_prompt),
+                    temperature=temperature,
+                    stream=True,
+                    **_prompt_cache_params(system_prompt),
+                )
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            except Exception as e:
+                msg = f"OpenAI API error: {e}"
+                raise AIServiceError(msg) from e
+
+    async def generate_responses_batch(
+        self,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        model: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[str | Exception]:
+        """Generate responses for several prompts concurrently.
+
+        Requests are fanned out with ``asyncio.gather`` and always pass
+        through the provider-wide concurrency limit; ``max_concurrency``
+        optionally caps this batch further.
+        """
+        batch_limit = (
+            asyncio.Semaphore(max_concurrency)
+            if max_concurrency
+            else contextlib.nullcontext()
+        )
+
+        async def _generate(prompt: str) -> str:
+            async with batch_limit:
+                return await self.generate_response(
+                    prompt,
+                    system_prompt=system_prompt,
+                    temperature=temperature,
+                    model=model,
+                    tools=tools,
+                )
+
+        return await asyncio.gather(
+            *(_generate(prompt) for prompt in prompts), return_exceptions=True
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release its connections.
+
+        Shared clients passed in by the factory are left open; close them
+        with ``AIProviderFactory.close_all``.
+        """
+        if self.client and self._owns_client:
+            await self.client.close()
 
     def get_default_model(self) -> str:
         """Get default OpenAI model."""
-        return self.config.get("default_model", "gpt-4o-mini")
+        return self._default_model
 
-    def get_available_models(self) -> list[str]:
+    def get_available_models(self) -> tuple[str, ...]:
         """Get available OpenAI models."""
-        return [
-            "gpt-4.1",
-            "gpt-4o",
-            "gpt-4o-mini",
-            "gpt-4-turbo",
-        ]
+        return _OPENAI_MODELS
 
     @property
     def provider_name(self) -> str:
@@ -107,11 +442,4 @@ class OpenAIProvider(AIProvider):
     @property
     def is_available(self) -> bool:
         """Check if OpenAI provider is available."""
-        if not OPENAI_AVAILABLE:
-            return False
-
-        try:
-            api_key = self.config.get("api_key") or os.getenv("OPENAI_API_KEY")
-            return bool(api_key)
-        except Exception:
-            return False
+        return self._is_available
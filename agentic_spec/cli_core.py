@@ -5,7 +5,10 @@ and rendering - the fundamental operations of the tool.
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
 import logging
+import os
 from pathlib import Path
 import sys
 
@@ -23,16 +26,13 @@ from .exceptions import (
     TemplateError,
     ValidationError,
 )
-from .graph_visualization import (
-    get_spec_stats,
-    print_spec_graph,
-    print_task_tree,
-    visualize_spec_graph,
-)
 from .models import (
     ContextParameters,
+    ProgrammingSpec,
 )
 from .prompt_template_loader import PromptTemplateLoader
+from .utils.event_loop import run_async
+from .utils.yaml_codec import SafeDumper
 
 # Create the core command group
 core_app = typer.Typer(
@@ -81,14 +81,8 @@ def get_prompt_input(args_prompt: str | None) -> str:
     # 3. Interactive multiline input (lowest priority)
     print("Enter your prompt (press Ctrl+D on Unix/Ctrl+Z on Windows when done):")
     try:
-        lines = []
-        while True:
-            try:
-                line = input()
-                lines.append(line)
-            except EOFError:
-                break
-        prompt = "\n".join(lines).strip()
+        # One buffered read to EOF instead of an input() call per line
+        prompt = sys.stdin.read().strip()
         if prompt:
             logger.debug("Using interactive input prompt")
             return prompt
@@ -101,15 +95,20 @@ def get_prompt_input(args_prompt: str | None) -> str:
         sys.exit(1)
 
 
-def _is_internal_template(template_name: str) -> bool:
-    """Check if a template is internal (used by the system) vs user-facing."""
-    internal_templates = {
+# Prompt templates the generator uses itself, hidden from template selection
+_INTERNAL_TEMPLATES = frozenset(
+    {
         "specification-generation",
         "specification-review",
         "step-expansion",
         "context-enhancement",
     }
-    return template_name in internal_templates
+)
+
+
+def _is_internal_template(template_name: str) -> bool:
+    """Check if a template is internal (used by the system) vs user-facing."""
+    return template_name in _INTERNAL_TEMPLATES
 
 
 async def _handle_template_selection(
@@ -207,6 +206,26 @@ async def initialize_generator(
     cli_overrides: list[str] | None = None,
 ) -> SpecGenerator:
     """Initialize the SpecGenerator with configuration."""
+    return initialize_generator_sync(
+        spec_templates_dir,
+        specs_dir,
+        config_file,
+        discovery_config_file,
+        cli_overrides,
+    )
+
+
+def initialize_generator_sync(
+    spec_templates_dir: Path,
+    specs_dir: Path,
+    config_file: Path | None = None,
+    discovery_config_file: Path | None = None,
+    cli_overrides: list[str] | None = None,
+) -> SpecGenerator:
+    """Initialize the SpecGenerator for commands that do no async work.
+
+    Nothing in the setup awaits, so these commands need no event loop.
+    """
     logger = logging.getLogger("agentic_spec")
 
     try:
@@ -310,14 +329,16 @@ def generate_spec(
         "--dry-run",
         help="Preview what would be generated without saving to file",
     ),
-    spec_templates_dir: str = Option(
-        "spec-templates",
+    spec_templates_dir: Path = Option(
+        Path("spec-templates"),
         "--spec-templates-dir",
         "--templates-dir",
         help="YAML spec templates directory",
     ),
-    specs_dir: str = Option("specs", "--specs-dir", help="Generated specs directory"),
-    config: str | None = Option(None, "--config", help="Path to configuration file"),
+    specs_dir: Path = Option(
+        Path("specs"), "--specs-dir", help="Generated specs directory"
+    ),
+    config: Path | None = Option(None, "--config", help="Path to configuration file"),
     set_options: list[str] | None = Option(
         None,
         "--set",
@@ -343,17 +364,16 @@ def generate_spec(
         inherits_list = inherits if inherits is not None else []
         set_options_list = set_options if set_options is not None else []
 
-        # Convert string paths to Path objects
-        spec_templates_dir_path = Path(spec_templates_dir)
-        specs_dir_path = Path(specs_dir)
-        config_path = Path(config) if config else None
+        # The database is opened by the first save and reused by the review
+        # and feedback updates, then closed once the command is done
+        db_stack = AsyncExitStack()
 
         try:
             try:
                 generator = await initialize_generator(
-                    spec_templates_dir_path,
-                    specs_dir_path,
-                    config_path,
+                    spec_templates_dir,
+                    specs_dir,
+                    config,
                     set_options_list,
                 )
             except (ConfigurationError, FileSystemError) as e:
@@ -442,15 +462,17 @@ def generate_spec(
                 print("📄 Full YAML specification:")
                 print("-" * 40)
 
-                # Show the YAML content
+                # Show the YAML content, emitted straight to stdout
                 import yaml
 
-                spec_yaml = yaml.dump(
+                yaml.dump(
                     spec.model_dump(exclude_none=True, mode="json"),
+                    sys.stdout,
+                    Dumper=SafeDumper,
                     default_flow_style=False,
                     sort_keys=False,
                 )
-                print(spec_yaml)
+                print()
 
                 print("-" * 40)
                 print("💡 Use without --dry-run to save this specification")
@@ -458,15 +480,23 @@ def generate_spec(
             else:
                 # Save specification with error handling
                 try:
-                    spec_path = generator.save_spec(spec)
-                    logger.info("Specification saved to %s", spec_path)
+                    db_path = specs_dir / "specifications.db"
+                    manager = await db_stack.enter_async_context(
+                        AsyncSpecManager(SQLiteBackend(db_path))
+                    )
 
-                    # Also save to database
-                    db_path = Path(specs_dir) / "specifications.db"
-                    backend = SQLiteBackend(str(db_path))
-                    async with AsyncSpecManager(backend) as manager:
-                        await manager.save_spec_to_db(spec)
-                        logger.info("Specification saved to database")
+                    # The file and database writes are independent. A failure
+                    # cancels the other write before the database is closed.
+                    try:
+                        async with asyncio.TaskGroup() as tg:
+                            save_file = tg.create_task(generator.save_spec_async(spec))
+                            tg.create_task(manager.save_spec_to_db(spec))
+                    except ExceptionGroup as group:
+                        # Re-raise the write's own error for the handler below
+                        raise group.exceptions[0] from None
+                    spec_path = save_file.result()
+                    logger.info("Specification saved to %s", spec_path)
+                    logger.info("Specification saved to database")
 
                 except Exception as e:
                     logger.exception("Error saving specification")
@@ -479,6 +509,10 @@ def generate_spec(
                 print(f"📅 Created: {spec.metadata.created}")
                 print("💾 Saved to database")
 
+            # Review notes and feedback are written back to the spec file
+            # once, after both steps
+            spec_file_stale = False
+
             # Auto-review if enabled in config (but skip in dry-run)
             if not dry_run and generator.config.workflow.auto_review:
                 try:
@@ -487,13 +521,10 @@ def generate_spec(
 
                     if review_notes:
                         spec.review_notes = review_notes
-                        generator.save_spec(spec)  # Save with review notes
+                        spec_file_stale = True
 
                         # Update database with review notes
-                        db_path = Path(specs_dir) / "specifications.db"
-                        backend = SQLiteBackend(str(db_path))
-                        async with AsyncSpecManager(backend) as manager:
-                            await manager.save_spec_to_db(spec)
+                        await manager.save_spec_to_db(spec)
 
                         logger.info("Review notes added to specification")
 
@@ -511,14 +542,12 @@ def generate_spec(
                         output_content=str(spec_path), interactive=True
                     )
                     if feedback_data:
+                        # Feedback is only kept in the spec file; the
+                        # database has no column for it
                         spec.feedback_history.append(feedback_data)
-                        generator.save_spec(spec)  # Save with feedback
-
-                        # Update database with feedback
-                        db_path = Path(specs_dir) / "specifications.db"
-                        backend = SQLiteBackend(str(db_path))
-                        async with AsyncSpecManager(backend) as manager:
-                            await manager.save_spec_to_db(spec)
+                        spec_file_stale = True
+                        generator.save_spec(spec)
+                        spec_file_stale = False
 
                         print("💾 Feedback saved with specification")
                         logger.info("User feedback collected and saved")
@@ -526,6 +555,9 @@ def generate_spec(
                     logger.warning("Feedback collection failed: %s", e)
                     print("⚠️  Feedback collection failed, continuing without feedback")
 
+            if spec_file_stale:
+                generator.save_spec(spec)  # Save with review notes
+
             print(
                 "\n💡 Next step: Review and approve specification before implementation"
             )
@@ -542,8 +574,10 @@ def generate_spec(
             logger.exception("Unexpected error during generation")
             print("❌ Failed to generate specification")
             raise typer.Exit(1) from None
+        finally:
+            await db_stack.aclose()
 
-    asyncio.run(_generate())
+    run_async(_generate())
 
 
 @core_app.command("review")
@@ -571,7 +605,13 @@ def review_specs(
             msg = "Specifications directory not found"
             raise FileSystemError(msg)
 
-        specs = list(specs_dir_path.glob("*.yaml"))
+        # A plain suffix check skips glob's per-entry pattern matching
+        with os.scandir(specs_dir_path) as entries:
+            specs = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".yaml") and entry.is_file()
+            ]
         if not specs:
             logger.info("No specifications found for review")
             print("❌ No specifications found")
@@ -582,16 +622,25 @@ def review_specs(
         # Create a spec generator to load specs
         spec_gen = SpecGenerator(Path(templates_dir), specs_dir_path)
 
-        for i, spec_path in enumerate(specs):
+        def load_or_none(spec_path: Path) -> ProgrammingSpec | None:
             try:
-                spec = spec_gen.load_spec(spec_path)
-                title = spec.metadata.title
-                spec_id = spec.metadata.id
-                status_emoji = "🚀" if spec.metadata.status == "implemented" else "📝"
-                print(f"  {i}: {status_emoji} {title} ({spec_id})")
+                return spec_gen.load_spec(spec_path)
             except Exception:
+                return None
+
+        # Loading is file reads and libyaml parsing, so threads overlap it
+        with ThreadPoolExecutor(max_workers=min(32, len(specs))) as executor:
+            loaded = list(executor.map(load_or_none, specs))
+
+        for i, (spec_path, spec) in enumerate(zip(specs, loaded, strict=True)):
+            if spec is None:
                 # Fallback to filename if loading fails
                 print(f"  {i}: {spec_path.name}")
+                continue
+            title = spec.metadata.title
+            spec_id = spec.metadata.id
+            status_emoji = "🚀" if spec.metadata.status == "implemented" else "📝"
+            print(f"  {i}: {status_emoji} {title} ({spec_id})")
 
         logger.info("Listed %d specifications", len(specs))
 
@@ -705,10 +754,16 @@ def show_graph(
     Shows a visual representation of how specifications relate to each other
     and provides statistics about the specification tree.
     """
+    # graph_visualization pulls in matplotlib and networkx, so it is only
+    # imported by the commands that draw graphs
+    from .graph_visualization import (
+        get_spec_stats,
+        print_spec_graph,
+        visualize_spec_graph,
+    )
+
     # If output image requested, generate visualization
     if output_image:
-        from pathlib import Path
-
         visualize_spec_graph(Path(specs_dir), output_image, show_tasks=show_tasks)
     else:
         # Show ASCII graph
@@ -736,7 +791,7 @@ def show_task_tree(
     Shows all tasks and their sub-specifications in a hierarchical view.
     Useful for understanding the complete implementation breakdown.
     """
-    from pathlib import Path
+    from .graph_visualization import print_task_tree, visualize_spec_graph
 
     if output_image:
         # Generate image with tasks visible
@@ -750,14 +805,16 @@ def show_task_tree(
 @core_app.command("expand")
 def expand_step(
     step_id: str = Argument(..., help="Step to expand in format 'spec_id:step_index'"),
-    spec_templates_dir: str = Option(
-        "spec-templates",
+    spec_templates_dir: Path = Option(
+        Path("spec-templates"),
         "--spec-templates-dir",
         "--templates-dir",
         help="YAML spec templates directory",
     ),
-    specs_dir: str = Option("specs", "--specs-dir", help="Generated specs directory"),
-    config: str | None = Option(None, "--config", help="Path to configuration file"),
+    specs_dir: Path = Option(
+        Path("specs"), "--specs-dir", help="Generated specs directory"
+    ),
+    config: Path | None = Option(None, "--config", help="Path to configuration file"),
     set_options: list[str] | None = Option(
         None,
         "--set",
@@ -788,17 +845,12 @@ def expand_step(
             print("❌ Step index must be a number")
             raise typer.Exit(1)
 
-        # Convert string paths to Path objects
-        spec_templates_dir_path = Path(spec_templates_dir)
-        specs_dir_path = Path(specs_dir)
-        config_path = Path(config) if config else None
-
         try:
             try:
                 generator = await initialize_generator(
-                    spec_templates_dir_path,
-                    specs_dir_path,
-                    config_path,
+                    spec_templates_dir,
+                    specs_dir,
+                    config,
                     None,
                     set_options_list,
                 )
@@ -823,15 +875,38 @@ def expand_step(
 
             # Save the expanded specification
             try:
-                spec_path = generator.save_spec(expanded_spec)
-                logger.info("Expanded specification saved to %s", spec_path)
+                # Also save to database, together with the parent that
+                # expand_step linked the new child to. Finding it reads spec
+                # files, so it runs in a thread.
+                parent_spec = await asyncio.to_thread(
+                    generator.find_spec_by_id, spec_id
+                )
 
-                # Also save to database
-                db_path = Path(specs_dir) / "specifications.db"
-                backend = SQLiteBackend(str(db_path))
-                async with AsyncSpecManager(backend) as manager:
-                    await manager.save_spec_to_db(expanded_spec)
-                    logger.info("Expanded specification saved to database")
+                async def save_to_db():
+                    db_path = specs_dir / "specifications.db"
+                    backend = SQLiteBackend(db_path)
+                    async with (
+                        AsyncSpecManager(backend) as manager,
+                        manager.transaction(),
+                    ):
+                        await manager.save_spec_to_db(expanded_spec)
+                        if parent_spec:
+                            await manager.save_spec_to_db(parent_spec)
+
+                # The file and database writes are independent. A failure
+                # cancels the other write.
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        save_file = tg.create_task(
+                            generator.save_spec_async(expanded_spec)
+                        )
+                        tg.create_task(save_to_db())
+                except ExceptionGroup as group:
+                    # Re-raise the write's own error for the handler below
+                    raise group.exceptions[0] from None
+                spec_path = save_file.result()
+                logger.info("Expanded specification saved to %s", spec_path)
+                logger.info("Expanded specification saved to database")
 
             except Exception as e:
                 logger.exception("Error saving expanded specification")
@@ -856,4 +931,4 @@ def expand_step(
             print("❌ Failed to expand step")
             raise typer.Exit(1) from None
 
-    asyncio.run(_expand())
+    run_async(_expand())
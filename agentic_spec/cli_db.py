@@ -4,7 +4,6 @@ This module contains commands related to database operations, migrations,
 and persistent storage management.
 """
 
-import asyncio
 import json
 from pathlib import Path
 
@@ -13,6 +12,7 @@ from typer import Option
 import yaml
 
 from .core import SpecGenerator
+from .utils.event_loop import run_async
 
 # Create the database command group
 db_app = typer.Typer(
@@ -51,7 +51,7 @@ def migrate_bulk(
                 progress_callback=progress_callback,
             )
 
-        results = asyncio.run(run_migration())
+        results = run_async(run_migration())
 
         # Display results
         action = "Validated" if dry_run else "Migrated"
@@ -129,7 +129,7 @@ def migrate_incremental(
                 progress_callback=progress_callback,
             )
 
-        results = asyncio.run(run_migration())
+        results = run_async(run_migration())
 
         # Display results
         action = "Validated" if dry_run else "Migrated"
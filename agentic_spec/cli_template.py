@@ -22,10 +22,13 @@ def list_templates():
     return ["base-coding-standards.yaml", "web-api.yaml", "cli-application.yaml"]
 
 
+# Name prefixes that mark a prompt template as internal
+_INTERNAL_PREFIXES = ("_", "internal-", "system-")
+
+
 def _is_internal_template(name: str) -> bool:
     """Check if a template is internal (used by the system)."""
-    internal_prefixes = ["_", "internal-", "system-"]
-    return any(name.startswith(prefix) for prefix in internal_prefixes)
+    return name.startswith(_INTERNAL_PREFIXES)
 
 
 # Create the template command group
@@ -136,8 +139,13 @@ def browse_templates(
         print("=" * 50)
 
         # Separate user-facing templates from internal ones
-        user_templates = [t for t in templates if not _is_internal_template(t.name)]
-        internal_templates = [t for t in templates if _is_internal_template(t.name)]
+        user_templates = []
+        internal_templates = []
+        for t in templates:
+            if _is_internal_template(t.name):
+                internal_templates.append(t)
+            else:
+                user_templates.append(t)
 
         if user_templates:
             print("\n🎯 User Templates:")
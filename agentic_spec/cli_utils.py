@@ -4,29 +4,26 @@ This module contains utility commands that don't fit into other categories,
 such as configuration, initialization, and prompt management.
 """
 
-import asyncio
-import dataclasses
-import json
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import logging
 import os
 from pathlib import Path
+from string import Template
 
 import typer
 from typer import Argument, Option
 import yaml
 
-from .cli_core import initialize_generator
+from .cli_core import initialize_generator_sync
 from .config import AgenticSpecConfig, get_config_manager
 from .core import SpecGenerator
 from .exceptions import ConfigurationError, SyncFoundationConfigError, TemplateError
-from .prompt_editor import PromptEditor
 from .template_loader import render_specification_template
 from .template_validator import TemplateValidator
 from .templates.base import create_base_templates
-from .templates.default_specs import (
-    create_default_specification_templates,
-    create_getting_started_guide,
-)
+from .utils.json_codec import json_dumps_pretty
+from .utils.yaml_codec import SafeDumper, SafeLoader
 
 # Create the utility command group
 utils_app = typer.Typer(
@@ -36,31 +33,61 @@ utils_app = typer.Typer(
 )
 
 
-def _create_basic_prompt_templates(prompt_templates_dir: Path, project_name: str):
-    """Create basic prompt templates for common use cases."""
+@functools.lru_cache(maxsize=1)
+def _load_templates_config() -> dict | None:
+    """Load the packaged basic prompt templates configuration.
+
+    The file ships with the package and never changes at runtime, so it is
+    parsed once per process. Returns None if the file is missing. Callers
+    must not modify the returned dict.
+    """
     import importlib.resources
 
+    templates_package = importlib.resources.files("agentic_spec.templates")
+    config_file = templates_package / "basic_prompt_templates.yaml"
+    if not config_file.is_file():
+        return None
+    return yaml.load(config_file.read_text(encoding="utf-8"), Loader=SafeLoader)
+
+
+def _write_text_files(directory: Path, files: dict[str, str]) -> None:
+    """Write small independent files concurrently to hide filesystem latency.
+
+    Raises the first error from any write once all writes have finished.
+    """
+    with ThreadPoolExecutor(max_workers=min(len(files), 4) or 1) as executor:
+        futures = [
+            executor.submit((directory / name).write_text, content, encoding="utf-8")
+            for name, content in files.items()
+        ]
+    for future in futures:
+        future.result()
+
+
+def _create_basic_prompt_templates(prompt_templates_dir: Path, project_name: str):
+    """Create basic prompt templates for common use cases."""
     # Try to load templates from configuration file
     try:
-        # Get the path to the templates configuration file
-        templates_package = importlib.resources.files("agentic_spec.templates")
-        config_file = templates_package / "basic_prompt_templates.yaml"
-
-        if config_file.is_file():
-            # Read and parse the YAML configuration
-            config_content = config_file.read_text(encoding="utf-8")
-            templates_config = yaml.safe_load(config_content)
-
-            # Create templates from configuration
-            for template_name, template_data in templates_config.get(
-                "templates", {}
-            ).items():
-                template_file = prompt_templates_dir / f"{template_name}.md"
-                with template_file.open("w", encoding="utf-8") as f:
-                    f.write(template_data["content"].format(project_name=project_name))
+        templates_config = _load_templates_config()
+        templates = (templates_config or {}).get("templates")
+
+        if templates:
+            # Create templates from configuration. Only the {{project_name}}
+            # placeholder is filled in; the other {{...}} placeholders and
+            # the JSON examples in the templates are left untouched.
+            _write_text_files(
+                prompt_templates_dir,
+                {
+                    f"{template_name}.md": template_data["content"].replace(
+                        "{{project_name}}", project_name
+                    )
+                    for template_name, template_data in templates.items()
+                },
+            )
 
         else:
             # Fallback to hardcoded templates if config file doesn't exist
+            # or defines no templates
             _create_fallback_prompt_templates(prompt_templates_dir, project_name)
 
     except Exception:
@@ -68,15 +95,17 @@ def _create_basic_prompt_templates(prompt_templates_dir: Path, project_name: str
         _create_fallback_prompt_templates(prompt_templates_dir, project_name)
 
 
-def _create_fallback_prompt_templates(prompt_templates_dir: Path, project_name: str):
-    """Create fallback prompt templates when config file is not available."""
-    templates = {
-        "basic-specification.md": f"""# Basic Specification Template
+# Fallback prompt templates, written by init when the packaged template
+# configuration cannot be loaded. Only $project_name is substituted; {prompt}
+# is left for the user to fill in.
+_FALLBACK_PROMPT_TEMPLATES: dict[str, Template] = {
+    "basic-specification.md": Template(
+        """# Basic Specification Template
 
-Generate a comprehensive programming specification for: {{prompt}}
+Generate a comprehensive programming specification for: {prompt}
 
 ## Project Context
-Project: {project_name}
+Project: $project_name
 Domain: General software development
 Target: Production-ready implementation
 
@@ -89,10 +118,12 @@ Create detailed specifications including:
 - Documentation needs
 
 Focus on practical, actionable specifications that a developer can follow immediately.
-""",
-        "feature-addition.md": f"""# Feature Addition Template
+"""
+    ),
+    "feature-addition.md": Template(
+        """# Feature Addition Template
 
-Add a new feature to {project_name}: {{prompt}}
+Add a new feature to $project_name: {prompt}
 
 ## Integration Focus
 - Surgical feature integration with focus on clean architectural alignment
@@ -107,10 +138,12 @@ Add a new feature to {project_name}: {{prompt}}
 - Include rollback considerations
 
 Generate a specification that seamlessly integrates the new feature while maintaining system integrity.
-""",
-        "bug-fix.md": f"""# Bug Fix Template
+"""
+    ),
+    "bug-fix.md": Template(
+        """# Bug Fix Template
 
-Fix the following issue in {project_name}: {{prompt}}
+Fix the following issue in $project_name: {prompt}
 
 ## Debugging Approach
 - Root cause analysis methodology
@@ -125,13 +158,20 @@ Fix the following issue in {project_name}: {{prompt}}
 - Monitoring and validation steps
 
 Generate a specification focused on reliable, well-tested bug resolution.
-""",
-    }
+"""
+    ),
+}
 
-    for template_name, content in templates.items():
-        template_file = prompt_templates_dir / template_name
-        with template_file.open("w", encoding="utf-8") as f:
-            f.write(content)
+
+def _create_fallback_prompt_templates(prompt_templates_dir: Path, project_name: str):
+    """Create fallback prompt templates when config file is not available."""
+    _write_text_files(
+        prompt_templates_dir,
+        {
+            filename: template.substitute(project_name=project_name)
+            for filename, template in _FALLBACK_PROMPT_TEMPLATES.items()
+        },
+    )
 
 
 @utils_app.command("init")
@@ -168,11 +208,14 @@ def init_project(
 
         print("📁 Creating directories...")
         try:
-            spec_templates_path.mkdir(exist_ok=True)
-            prompt_templates_path.mkdir(exist_ok=True)
-            specs_path.mkdir(exist_ok=True)
-            logs_path = Path("logs")
-            logs_path.mkdir(exist_ok=True)
+            # mkdir is attempted directly; exist_ok only stats on EEXIST
+            for path in (
+                spec_templates_path,
+                prompt_templates_path,
+                specs_path,
+                Path("logs"),
+            ):
+                path.mkdir(exist_ok=True)
         except OSError as e:
             print(f"❌ Error creating directories: {e}")
             print("💡 Check that you have write permissions in the current directory")
@@ -289,8 +332,15 @@ def init_project(
                     print("❌ Setup cancelled (non-interactive mode).")
                     return
 
-            with config_file.open("w") as f:
-                yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+            config_file.write_text(
+                yaml.dump(
+                    config_data,
+                    Dumper=SafeDumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                ),
+                encoding="utf-8",
+            )
 
             print(f"  ✅ {config_file}")
         except (OSError, PermissionError) as e:
@@ -337,6 +387,11 @@ def init_project(
         # Create default specification examples
         print("📋 Creating example specifications...")
         try:
+            from .templates.default_specs import (
+                create_default_specification_templates,
+                create_getting_started_guide,
+            )
+
             created_specs = create_default_specification_templates(
                 specs_path, project_name
             )
@@ -429,7 +484,7 @@ def manage_config(
             print("📋 Current Configuration:")
             print("=" * 50)
             config_dict = config_data.model_dump()
-            print(json.dumps(config_dict, indent=2))
+            print(json_dumps_pretty(config_dict))
 
         elif action == "validate":
             # Validate configuration file
@@ -589,11 +644,11 @@ def render_spec(
     either displaying the result or saving it to a file.
     """
 
-    async def _render():
+    def _render():
         logger = logging.getLogger("agentic_spec")
 
         try:
-            generator = await initialize_generator(
+            generator = initialize_generator_sync(
                 templates_dir, specs_dir, config, set_options
             )
 
@@ -608,7 +663,7 @@ def render_spec(
             )
 
             # Convert spec to dict for template rendering
-            spec_dict = dataclasses.asdict(target_spec)
+            spec_dict = target_spec.model_dump(mode="json")
 
             # Render template
             rendered = render_specification_template(spec_dict, template_name)
@@ -627,7 +682,7 @@ def render_spec(
             print("❌ Failed to render template")
             raise typer.Exit(1) from None
 
-    asyncio.run(_render())
+    _render()
 
 
 @utils_app.command("prompt")
@@ -646,6 +701,8 @@ def prompt_command(
     logger = logging.getLogger("agentic_spec")
 
     try:
+        from .prompt_editor import PromptEditor
+
         editor = PromptEditor(Path(config_dir))
 
         if action == "edit" or action == "new":
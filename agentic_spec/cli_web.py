@@ -15,11 +15,9 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 import typer
-import uvicorn
 
+from .async_db import DEFAULT_DB_PATH as DB_PATH
 from .config import AgenticSpecConfig, get_config_manager, load_config
-from .web_ui import DB_PATH
-from .web_ui import app as web_app
 
 # Create Typer app
 app = typer.Typer(
@@ -105,6 +103,12 @@ def start(
         )
         return
 
+    # Imported here so that loading the CLI does not import uvicorn and the
+    # FastAPI app
+    import uvicorn
+
+    from .web_ui import app as web_app
+
     # Start server in background thread
     def run_server():
         global _server
@@ -4,7 +4,6 @@ This module contains commands related to workflow management, task tracking,
 and specification lifecycle operations.
 """
 
-import asyncio
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -14,7 +13,7 @@ import typer
 from typer import Argument, Option
 
 from .async_db import AsyncSpecManager, SQLiteBackend
-from .cli_core import initialize_generator
+from .cli_core import initialize_generator, initialize_generator_sync
 from .core import GitUtility
 from .exceptions import (
     AgenticSpecError,
@@ -22,14 +21,15 @@ from .exceptions import (
     SpecificationError,
     SyncFoundationConfigError,
 )
-from .graph_visualization import print_spec_graph
 from .models import (
+    DONE_TASK_STATUSES,
     ApprovalDB,
     ApprovalLevel,
     SpecStatus,
     TaskStatus,
     WorkflowStatus,
 )
+from .utils.event_loop import run_async
 
 # Create the workflow command group
 workflow_app = typer.Typer(
@@ -181,7 +181,7 @@ def start_task(
             print(f"❌ Error starting task: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(start_task_async())
+    run_async(start_task_async())
 
 
 @workflow_app.command("task-complete")
@@ -350,7 +350,7 @@ def complete_task(
             print(f"❌ Error completing task: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(complete_task_async())
+    run_async(complete_task_async())
 
 
 @workflow_app.command("workflow-status")
@@ -379,9 +379,7 @@ def show_workflow_status(
             # Calculate status
             total_tasks = len(tasks)
             completed_tasks = sum(
-                1
-                for task in tasks
-                if task.status in [TaskStatus.COMPLETED, TaskStatus.APPROVED]
+                1 for task in tasks if task.status in DONE_TASK_STATUSES
             )
             completion_percentage = (
                 (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
@@ -434,7 +432,7 @@ def show_workflow_status(
             }
 
     try:
-        status = asyncio.run(get_workflow_status_async())
+        status = run_async(get_workflow_status_async())
 
         print(f"📊 Workflow Status: {spec_id}")
         print(f"   Title: {status['spec_title']}")
@@ -537,7 +535,10 @@ def publish_spec(
             print(f"✅ Specification {spec_id[:8]} published as implemented")
             print("📋 Status updated: draft → implemented")
 
-            # Show updated graph
+            # Show updated graph; imported here to keep matplotlib and
+            # networkx out of every other command's startup
+            from .graph_visualization import print_spec_graph
+
             print("\n📊 Updated specification graph:")
             print_spec_graph(specs_dir)
 
@@ -559,7 +560,7 @@ def publish_spec(
             print("❌ Failed to publish specification")
             raise typer.Exit(1) from None
 
-    asyncio.run(_publish())
+    run_async(_publish())
 
 
 @workflow_app.command("task-approve")
@@ -678,7 +679,7 @@ def approve_task(
             print(f"❌ Error approving task: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(approve_task_async())
+    run_async(approve_task_async())
 
 
 @workflow_app.command("task-reject")
@@ -771,7 +772,7 @@ def reject_task(
             print(f"❌ Error rejecting task: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(reject_task_async())
+    run_async(reject_task_async())
 
 
 @workflow_app.command("task-block")
@@ -856,7 +857,7 @@ def block_task(
             print(f"❌ Error blocking task: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(block_task_async())
+    run_async(block_task_async())
 
 
 @workflow_app.command("task-unblock")
@@ -925,7 +926,7 @@ def unblock_task(
             print(f"❌ Error unblocking task: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(unblock_task_async())
+    run_async(unblock_task_async())
 
 
 @workflow_app.command("task-override")
@@ -994,7 +995,7 @@ def override_strict_mode(
             print(f"❌ Error overriding strict mode: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(override_task_async())
+    run_async(override_task_async())
 
 
 @workflow_app.command("task-status")
@@ -1095,7 +1096,7 @@ def show_task_status(
             print(f"❌ Error getting task status: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(show_task_status_async())
+    run_async(show_task_status_async())
 
 
 @workflow_app.command("sync-foundation")
@@ -1127,10 +1128,10 @@ def sync_foundation_spec(
     • Comprehensive skip patterns for virtual environments and build artifacts
     """
 
-    async def _sync():
+    def _sync():
         logger = logging.getLogger("agentic_spec")
         try:
-            generator = await initialize_generator(
+            generator = initialize_generator_sync(
                 templates_dir, specs_dir, config, discovery_config, set_options
             )
             print("🔍 Analyzing current codebase...")
@@ -1190,7 +1191,7 @@ def sync_foundation_spec(
             )
             raise typer.Exit(1) from None
 
-    asyncio.run(_sync())
+    _sync()
 
 
 @workflow_app.command("check-foundation")
@@ -1207,10 +1208,10 @@ def check_foundation_status(
     with the current codebase state.
     """
 
-    async def _check():
+    def _check():
         logger = logging.getLogger("agentic_spec")
         try:
-            generator = await initialize_generator(
+            generator = initialize_generator_sync(
                 templates_dir, specs_dir, config, set_options
             )
             print("🔍 Checking foundation spec status...")
@@ -1238,7 +1239,7 @@ def check_foundation_status(
             msg = "Failed to check foundation status"
             raise SpecificationError(msg, str(e)) from e
 
-    asyncio.run(_check())
+    _check()
 
 
 @workflow_app.command("inject-task")
@@ -1336,7 +1337,7 @@ def inject_task_command(
             print(f"❌ Error injecting task: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(inject_task_async())
+    run_async(inject_task_async())
 
 
 @workflow_app.command("batch-inject")
@@ -1463,7 +1464,7 @@ def batch_inject_tasks_command(
             print(f"❌ Error in batch injection: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(batch_inject_async())
+    run_async(batch_inject_async())
 
 
 @workflow_app.command("injection-status")
@@ -1473,10 +1474,10 @@ def injection_status_command(
 ):
     """Show detailed injection status and history for a specification."""
 
-    async def injection_status_async():
+    def _injection_status():
         try:
             # Initialize generator
-            generator = await initialize_generator(Path("templates"), Path(specs_dir))
+            generator = initialize_generator_sync(Path("templates"), Path(specs_dir))
 
             # Load specification
             spec = generator.find_spec_by_id(spec_id)
@@ -1551,4 +1552,4 @@ def injection_status_command(
             print(f"❌ Error checking injection status: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(injection_status_async())
+    _injection_status()
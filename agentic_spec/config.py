@@ -1,5 +1,7 @@
 """Configuration system for agentic-spec workflows."""
 
+import copy
+import functools
 from pathlib import Path
 from typing import Any
 
@@ -7,6 +9,18 @@ from pydantic import BaseModel, Field, ValidationError, field_validator
 import yaml
 
 from .utils.deep_merge import merge_configs
+from .utils.yaml_codec import SafeDumper, SafeLoader
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a YAML config file, memoized per path and file version.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    file is parsed again. Callers must copy the result before changing it.
+    """
+    with path.open() as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
 
 
 class PromptSettings(BaseModel):
@@ -70,8 +84,20 @@ class AIProviderConfig(BaseModel):
     base_url: str | None = None
     default_model: str | None = None
     timeout: float = 120.0
+    max_retries: int = 3
+    max_concurrency: int = 16
+    max_connections: int = 100
+    cache_maxsize: int = 1024
+    cache_ttl_s: float = 3600.0
+    enable_telemetry: bool = False
     custom_settings: dict[str, Any] = Field(default_factory=dict)
 
+    @field_validator("provider_type")
+    @classmethod
+    def normalize_provider_type(cls, v: str) -> str:
+        """Normalize provider type to the lowercase registry key."""
+        return v.strip().lower()
+
 
 class AISettings(BaseModel):
     """Configuration for AI providers."""
@@ -442,20 +468,35 @@ class ConfigManager:
     def __init__(self, config_file: Path | None = None):
         self.config_file = config_file or Path("agentic_spec_config.yaml")
         self._config: AgenticSpecConfig | None = None
+        # (mtime_ns, size) of the file _config was built from, None if absent
+        self._config_stamp: tuple[int, int] | None = None
+
+    def _file_stamp(self) -> tuple[int, int] | None:
+        """Return the config file's (mtime_ns, size), or None if unreadable."""
+        try:
+            stat = self.config_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
     def load_config(self) -> AgenticSpecConfig:
-        """Load configuration from file with validation."""
-        if self._config is not None:
+        """Load configuration from file with validation.
+
+        The validated config is reused until the file's mtime or size changes.
+        """
+        stamp = self._file_stamp()
+        if self._config is not None and stamp == self._config_stamp:
             return self._config
 
         # Start with defaults
         config_data = {}
 
         # Load from file if it exists
-        if self.config_file.exists():
+        if stamp is not None:
             try:
-                with self.config_file.open() as f:
-                    file_config = yaml.safe_load(f) or {}
+                file_config = copy.deepcopy(
+                    _parse_config_file(self.config_file.resolve(), *stamp)
+                )
                 config_data = merge_configs(config_data, file_config)
             except yaml.YAMLError as e:
                 msg = f"Invalid YAML in config file {self.config_file}: {e}"
@@ -470,6 +511,7 @@ class ConfigManager:
         except ValidationError as e:
             msg = f"Configuration validation failed: {e}"
             raise ValueError(msg) from e
+        self._config_stamp = stamp
 
         return self._config
 
@@ -497,10 +539,17 @@ class ConfigManager:
         output_path = file_path or self.config_file
 
         # Convert to dict and save
-        config_dict = config.model_dump()
-
-        with output_path.open("w") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+        config_dict = config.model_dump(mode="json")
+
+        output_path.write_text(
+            yaml.dump(
+                config_dict,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            ),
+            encoding="utf-8",
+        )
 
         return output_path
 
@@ -571,7 +620,12 @@ _config_manager: ConfigManager | None = None
 def get_config_manager(config_file: Path | None = None) -> ConfigManager:
     """Get the global configuration manager instance."""
     global _config_manager
-    if _config_manager is None or config_file is not None:
+    if config_file is not None:
+        config_file = Path(config_file)
+    # Reuse the current manager, and its loaded config, for the same file
+    if _config_manager is None or (
+        config_file is not None and config_file != _config_manager.config_file
+    ):
         _config_manager = ConfigManager(config_file)
     return _config_manager
 
@@ -1,7 +1,9 @@
 """Core specification generation functionality."""
 
 # Removed dataclass asdict import - now using Pydantic model_dump
+import asyncio
 from datetime import datetime
+import glob
 import hashlib
 import json
 import os
@@ -27,6 +29,26 @@ from .models import (
 from .prompt_engineering import PromptEngineer
 from .prompt_template_loader import PromptTemplateLoader
 from .utils.deep_merge import merge_configs
+from .utils.json_codec import json_loads
+
+# Specs are dumped as plain JSON-mode data, which the safe dumper handles
+from .utils.yaml_codec import SafeDumper as _SafeDumper
+from .utils.yaml_codec import SafeLoader as _SafeLoader
+
+# save_spec writes the metadata block first with ``id`` as its first key, so a
+# spec's ID can be read from the head of its file without parsing the YAML
+_SPEC_HEAD_BYTES = 512
+_SPEC_ID_RE = re.compile(
+    rb"\Ametadata:\r?\n(?:[ \t]+.*\n)*?[ \t]+id:[ \t]*['\"]?([\w.-]+)['\"]?[ \t]*\r?$",
+    re.MULTILINE,
+)
+
+
+def _peek_spec_id(spec_file: Path) -> str | None:
+    """Return the metadata ID at the top of a spec file, or None if not found."""
+    with spec_file.open("rb") as f:
+        match = _SPEC_ID_RE.match(f.read(_SPEC_HEAD_BYTES))
+    return match.group(1).decode() if match else None
 
 
 class GitUtility:
@@ -1905,7 +1927,7 @@ Return ONLY valid JSON matching this structure:
             elif content.strip().startswith("{") and content.strip().endswith("}"):
                 content = content.strip()
 
-            return json.loads(content)
+            return json_loads(content)
 
         except (
             ConnectionError,
@@ -1961,6 +1983,7 @@ Return ONLY valid JSON matching this structure:
                     yaml.dump(
                         spec.model_dump(exclude_none=True, mode="json"),
                         f,
+                        Dumper=_SafeDumper,
                         default_flow_style=False,
                         sort_keys=False,
                         allow_unicode=True,
@@ -1978,6 +2001,7 @@ Return ONLY valid JSON matching this structure:
                 yaml.dump(
                     spec.model_dump(exclude_none=True, mode="json"),
                     f,
+                    Dumper=_SafeDumper,
                     default_flow_style=False,
                     sort_keys=False,
                     allow_unicode=True,
@@ -1985,6 +2009,10 @@ Return ONLY valid JSON matching this structure:
 
         return spec_path
 
+    async def save_spec_async(self, spec: ProgrammingSpec, atomic: bool = True) -> Path:
+        """Save specification to file without blocking the event loop."""
+        return await asyncio.to_thread(self.save_spec, spec, atomic)
+
     def inject_task_into_spec(
         self,
         spec_id: str,
@@ -2254,7 +2282,7 @@ Return ONLY valid JSON matching this structure:
     def load_spec(self, spec_path: Path) -> ProgrammingSpec:
         """Load specification from file with injection support."""
         with spec_path.open(encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
 
         # Handle backward compatibility for specs without title
         metadata = data["metadata"]
@@ -2361,8 +2389,8 @@ Return a simple JSON array of strings - no markdown formatting."""
             )
             # Try to parse as JSON, fallback to text
             try:
-                return json.loads(content)
-            except (json.JSONDecodeError, ValueError, TypeError):
+                return json_loads(content)
+            except (ValueError, TypeError):
                 return [content]
 
         except (
@@ -2475,12 +2503,28 @@ Return a simple JSON array of strings - no markdown formatting."""
 
         return sub_spec
 
+    def _list_spec_files(self) -> list[Path]:
+        """List the ``.yaml`` files in the specs directory.
+
+        A single scandir pass; the file type comes from the directory listing,
+        so regular files need no extra stat call.
+        """
+        try:
+            with os.scandir(self.specs_dir) as entries:
+                return [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".yaml") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
     def get_spec_graph(self) -> dict[str, dict[str, Any]]:
         """Build a graph of all specifications and their relationships."""
         specs = {}
 
         # Load all specs from directory
-        for spec_file in self.specs_dir.glob("*.yaml"):
+        for spec_file in self._list_spec_files():
             try:
                 spec = self.load_spec(spec_file)
                 specs[spec.metadata.id] = {
@@ -2495,9 +2539,23 @@ Return a simple JSON array of strings - no markdown formatting."""
         return specs
 
     def find_spec_by_id(self, spec_id: str) -> ProgrammingSpec | None:
-        """Find a specification by its ID."""
-        for spec_file in self.specs_dir.glob("*.yaml"):
+        """Find a specification by its ID.
+
+        save_spec names files ``<date>-<id>.yaml``, so a file with that name
+        is tried first. All files are scanned only if none of those match, and
+        only files whose ID cannot be read from their first lines, or matches,
+        are fully parsed.
+        """
+
+        def candidates():
+            yield from self.specs_dir.glob(f"*-{glob.escape(spec_id)}.yaml")
+            # Only list the whole directory if the named files did not match
+            yield from self._list_spec_files()
+
+        for spec_file in candidates():
             try:
+                if _peek_spec_id(spec_file) not in (None, spec_id):
+                    continue
                 spec = self.load_spec(spec_file)
                 if spec.metadata.id == spec_id:
                     return spec
@@ -2517,7 +2575,7 @@ Return a simple JSON array of strings - no markdown formatting."""
             List of Path objects for YAML files to process.
         """
         # Get all YAML files in specs directory
-        all_files = list(self.specs_dir.glob("*.yaml"))
+        all_files = self._list_spec_files()
 
         # Filter out non-specification files
         spec_files = []
@@ -2801,44 +2859,58 @@ Return a simple JSON array of strings - no markdown formatting."""
                 for i in range(0, len(files_to_migrate), batch_size):
                     batch = files_to_migrate[i : i + batch_size]
 
-                    for file_path in batch:
-                        try:
-                            # Progress update
-                            if progress_callback:
-                                progress_callback(f"Processing {file_path.name}...")
+                    # One commit per batch; each spec is saved in a nested
+                    # transaction (a savepoint), so a failed spec does not
+                    # undo the others
+                    async with backend.transaction():
+                        for file_path in batch:
+                            try:
+                                # Progress update
+                                if progress_callback:
+                                    progress_callback(f"Processing {file_path.name}...")
 
-                            # Validate file
-                            is_valid, data, error = self.validate_yaml_file(file_path)
-                            if not is_valid:
-                                results["errors"].append(
-                                    {
-                                        "file": str(file_path),
-                                        "error": f"Validation failed: {error}",
-                                    }
+                                # Validate file
+                                is_valid, data, error = self.validate_yaml_file(
+                                    file_path
                                 )
-                                continue
+                                if not is_valid:
+                                    results["errors"].append(
+                                        {
+                                            "file": str(file_path),
+                                            "error": f"Validation failed: {error}",
+                                        }
+                                    )
+                                    continue
 
-                            results["valid_files"] += 1
+                                results["valid_files"] += 1
 
-                            if error:  # Warning from basic validation
-                                results["warnings"].append(
-                                    {"file": str(file_path), "warning": error}
-                                )
+                                if error:  # Warning from basic validation
+                                    results["warnings"].append(
+                                        {"file": str(file_path), "warning": error}
+                                    )
 
-                            # Convert YAML data to database format
-                            try:
-                                migration_result = await self._migrate_single_spec(
-                                    spec_manager, data, file_path, dry_run
-                                )
+                                # Convert YAML data to database format
+                                try:
+                                    migration_result = await self._migrate_single_spec(
+                                        spec_manager, data, file_path, dry_run
+                                    )
 
-                                if migration_result["success"]:
-                                    migrated_count += 1
-                                    results["migrated_files"] += 1
-                                else:
+                                    if migration_result["success"]:
+                                        migrated_count += 1
+                                        results["migrated_files"] += 1
+                                    else:
+                                        results["errors"].append(
+                                            {
+                                                "file": str(file_path),
+                                                "error": migration_result["error"],
+                                            }
+                                        )
+
+                                except Exception as e:
                                     results["errors"].append(
                                         {
                                             "file": str(file_path),
-                                            "error": migration_result["error"],
+                                            "error": f"Migration error: {e!s}",
                                         }
                                     )
 
@@ -2846,18 +2918,10 @@ Return a simple JSON array of strings - no markdown formatting."""
                                 results["errors"].append(
                                     {
                                         "file": str(file_path),
-                                        "error": f"Migration error: {e!s}",
+                                        "error": f"Processing error: {e!s}",
                                     }
                                 )
 
-                        except Exception as e:
-                            results["errors"].append(
-                                {
-                                    "file": str(file_path),
-                                    "error": f"Processing error: {e!s}",
-                                }
-                            )
-
                     # Progress update after batch
                     if progress_callback:
                         progress_callback(
@@ -2907,8 +2971,8 @@ Return a simple JSON array of strings - no markdown formatting."""
                 return {"success": True, "action": "validated", "spec_id": spec_db.id}
 
             # Check if spec already exists to determine action
-            existing_spec = await spec_manager.get_specification(spec.metadata.id)
-            action = "updated" if existing_spec else "created"
+            exists = await spec_manager.specification_exists(spec.metadata.id)
+            action = "updated" if exists else "created"
 
             # Use save_spec_to_db which handles both specification and tasks
             await spec_manager.save_spec_to_db(spec)
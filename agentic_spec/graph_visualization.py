@@ -1,6 +1,7 @@
 """Graph visualization for specification relationships."""
 
 from pathlib import Path
+import sys
 from typing import Any
 
 from .core import SpecGenerator
@@ -229,8 +230,14 @@ def print_spec_graph(specs_dir: Path | str, show_tasks: bool = False):
         print("No specifications found")
         return
 
-    print("📊 Specification Graph:")
-    print("=" * 50)
+    # Lines are collected and written to stdout in one call at the end
+    lines = ["📊 Specification Graph:", "=" * 50]
+    status_emojis = {
+        "draft": "📝",
+        "reviewed": "👀",
+        "approved": "✅",
+        "implemented": "🚀",
+    }
 
     # Find root specs (no parent)
     root_specs = [spec_id for spec_id, data in spec_graph.items() if not data["parent"]]
@@ -244,24 +251,21 @@ def print_spec_graph(specs_dir: Path | str, show_tasks: bool = False):
         spec = spec_data["spec"]
 
         prefix = "  " * indent + ("├─ " if indent > 0 else "")
-        status_emoji = {
-            "draft": "📝",
-            "reviewed": "👀",
-            "approved": "✅",
-            "implemented": "🚀",
-        }.get(spec.metadata.status, "❓")
+        status_emoji = status_emojis.get(spec.metadata.status, "❓")
 
-        print(f"{prefix}{status_emoji} {spec_id[:8]} - {spec.context.project}")
-        print(f"{'  ' * (indent + 1)}📁 {spec_data['file_path'].name}")
+        lines.append(f"{prefix}{status_emoji} {spec_id[:8]} - {spec.context.project}")
+        lines.append(f"{'  ' * (indent + 1)}📁 {spec_data['file_path'].name}")
 
         # Print implementation steps with sub-specs
         for i, step in enumerate(spec.implementation):
             if show_tasks or step.sub_spec_id:
                 task_prefix = "  " * (indent + 1) + f"├─ Task {i}: "
                 if step.sub_spec_id:
-                    print(f"{task_prefix}🔗 {step.task} → {step.sub_spec_id[:8]}")
+                    lines.append(
+                        f"{task_prefix}🔗 {step.task} → {step.sub_spec_id[:8]}"
+                    )
                 elif show_tasks:
-                    print(f"{task_prefix}📋 {step.task}")
+                    lines.append(f"{task_prefix}📋 {step.task}")
 
         # Recursively print children
         for child_id in spec_data["children"]:
@@ -270,7 +274,7 @@ def print_spec_graph(specs_dir: Path | str, show_tasks: bool = False):
     # Print each root spec tree
     for root_id in root_specs:
         print_spec_tree(root_id)
-        print()
+        lines.append("")
 
     # Print orphaned specs (have parent but parent not found)
     orphaned = [
@@ -280,9 +284,13 @@ def print_spec_graph(specs_dir: Path | str, show_tasks: bool = False):
     ]
 
     if orphaned:
-        print("🔗 Orphaned specs (parent not found):")
-        for spec_id in orphaned:
-            print(f"  ❓ {spec_id[:8]} (parent: {spec_graph[spec_id]['parent'][:8]})")
+        lines.append("🔗 Orphaned specs (parent not found):")
+        lines.extend(
+            f"  ❓ {spec_id[:8]} (parent: {spec_graph[spec_id]['parent'][:8]})"
+            for spec_id in orphaned
+        )
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_task_tree(specs_dir: Path | str, spec_id: str):
@@ -21,6 +21,10 @@ class TaskStatus(str, Enum):
     REJECTED = "rejected"
 
 
+# Task statuses counted as done in progress and completion figures
+DONE_TASK_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.APPROVED})
+
+
 class ApprovalLevel(str, Enum):
     """Approval levels for task completion."""
 
@@ -1,11 +1,62 @@
 """Prompt template loading and rendering system."""
 
 from dataclasses import dataclass
+import functools
 from pathlib import Path
 from typing import Any
 
 import jinja2
 
+# Predefined metadata for known templates
+_KNOWN_TEMPLATE_INFO: dict[str, tuple[str, str]] = {
+    "basic-specification": (
+        "Comprehensive specification generation with balanced detail and practicality",
+        "Use for general programming tasks requiring complete coverage of all aspects",
+    ),
+    "feature-addition": (
+        "Surgical feature integration with focus on clean architectural alignment",
+        "Use when adding new functionality while maintaining existing patterns and quality",
+    ),
+    "bug-fix": (
+        "Minimal-scope bug fixes with maximum safety and regression prevention",
+        "Use when fixing specific issues without introducing new problems or feature creep",
+    ),
+    "refactoring": (
+        "Safe incremental code improvements without functional changes",
+        "Use when enhancing code quality, structure, or performance while preserving behavior",
+    ),
+    "specification-generation": (
+        "Primary template for AI-powered specification generation",
+        "Internal template used by the AI system (not typically user-selected)",
+    ),
+    "specification-review": (
+        "Template for AI-powered specification reviews and feedback",
+        "Internal template used for generating review feedback",
+    ),
+    "step-expansion": (
+        "Template for expanding implementation steps into sub-specifications",
+        "Internal template used for sub-specification generation",
+    ),
+    "context-enhancement": (
+        "Template for adding contextual information to prompts",
+        "Internal template used for context-aware prompt building",
+    ),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _read_first_line(path: Path, mtime_ns: int, size: int) -> str:
+    """Return a file's first non-blank line, memoized per path and version.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    file is read again.
+    """
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                return line.strip()
+    return ""
+
 
 @dataclass
 class TemplateMetadata:
@@ -128,10 +179,13 @@ class PromptTemplateLoader:
         if not template_path.exists():
             raise FileNotFoundError(f"Template not found: {template_name}")
 
-        # Read template content to extract description
-        content = template_path.read_text(encoding="utf-8")
+        # Known templates have predefined descriptions; custom ones are
+        # described by their first line, so only that is read
+        content = ""
+        if template_path.stem not in _KNOWN_TEMPLATE_INFO:
+            stat = template_path.stat()
+            content = _read_first_line(template_path, stat.st_mtime_ns, stat.st_size)
 
-        # Extract description from first few lines or use predefined mappings
         description, use_case = self._extract_template_info(template_path.stem, content)
 
         return TemplateMetadata(
@@ -173,44 +227,8 @@ class PromptTemplateLoader:
         Returns:
             Tuple of (description, use_case)
         """
-        # Predefined metadata for known templates
-        template_info = {
-            "basic-specification": (
-                "Comprehensive specification generation with balanced detail and practicality",
-                "Use for general programming tasks requiring complete coverage of all aspects",
-            ),
-            "feature-addition": (
-                "Surgical feature integration with focus on clean architectural alignment",
-                "Use when adding new functionality while maintaining existing patterns and quality",
-            ),
-            "bug-fix": (
-                "Minimal-scope bug fixes with maximum safety and regression prevention",
-                "Use when fixing specific issues without introducing new problems or feature creep",
-            ),
-            "refactoring": (
-                "Safe incremental code improvements without functional changes",
-                "Use when enhancing code quality, structure, or performance while preserving behavior",
-            ),
-            "specification-generation": (
-                "Primary template for AI-powered specification generation",
-                "Internal template used by the AI system (not typically user-selected)",
-            ),
-            "specification-review": (
-                "Template for AI-powered specification reviews and feedback",
-                "Internal template used for generating review feedback",
-            ),
-            "step-expansion": (
-                "Template for expanding implementation steps into sub-specifications",
-                "Internal template used for sub-specification generation",
-            ),
-            "context-enhancement": (
-                "Template for adding contextual information to prompts",
-                "Internal template used for context-aware prompt building",
-            ),
-        }
-
-        if template_name in template_info:
-            return template_info[template_name]
+        if template_name in _KNOWN_TEMPLATE_INFO:
+            return _KNOWN_TEMPLATE_INFO[template_name]
 
         # Fallback: extract description from content
         lines = content.strip().split("\n")
@@ -6,7 +6,7 @@ import re
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader, TemplateSyntaxError, meta
-from jinja2.nodes import Block, Extends, Include
+from jinja2.nodes import Block, Extends, Include, Template
 
 logger = logging.getLogger(__name__)
 
@@ -45,10 +45,26 @@ class TemplateValidator:
             "standalone": ["content"],
         }
 
+        # Parsed templates keyed by (name, mtime_ns, size), so a parent shared
+        # by several children is read and parsed once
+        self._parsed: dict[tuple[str, int, int], tuple[str, Template]] = {}
+
         logger.info(
             "Template validator initialized with directory: %s", self.templates_dir
         )
 
+    def _parse_template(self, template_name: str) -> tuple[str, Template]:
+        """Read and parse a template, memoized per file version."""
+        template_path = self.templates_dir / template_name
+        stat = template_path.stat()
+        key = (template_name, stat.st_mtime_ns, stat.st_size)
+        parsed = self._parsed.get(key)
+        if parsed is None:
+            source = template_path.read_text(encoding="utf-8")
+            parsed = (source, self.env.parse(source, template_name))
+            self._parsed[key] = parsed
+        return parsed
+
     def validate_template(self, template_name: str) -> dict[str, Any]:
         """Validate a single template.
 
@@ -80,14 +96,13 @@ class TemplateValidator:
                 return result
 
             # Parse template
-            source = template_path.read_text(encoding="utf-8")
-            ast = self.env.parse(source, template_name)
+            source, ast = self._parse_template(template_name)
 
             # Extract template metadata
             result["blocks"] = self._extract_blocks(ast)
             result["extends"] = self._extract_extends(ast)
             result["includes"] = self._extract_includes(ast)
-            result["variables"] = self._extract_variables(source)
+            result["variables"] = self._extract_variables(ast)
 
             # Determine template type
             template_type = self._determine_template_type(
@@ -95,9 +110,10 @@ class TemplateValidator:
             )
             result["info"]["type"] = template_type
 
-            # Validate syntax
+            # Validate syntax; compiling the parsed tree also catches errors
+            # such as unknown filters without reading the file again
             try:
-                self.env.get_template(template_name)
+                self.env.compile(ast, template_name)
                 result["info"]["syntax_valid"] = True
             except TemplateSyntaxError as e:
                 result["errors"].append(f"Syntax error: {e}")
@@ -192,10 +208,9 @@ class TemplateValidator:
         visit_includes(ast)
         return includes
 
-    def _extract_variables(self, source: str) -> list[str]:
+    def _extract_variables(self, ast: Template) -> list[str]:
         """Extract variable names used in template."""
         try:
-            ast = self.env.parse(source)
             variables = meta.find_undeclared_variables(ast)
             return list(variables)
         except (TemplateSyntaxError, AttributeError, ValueError) as e:
@@ -247,8 +262,7 @@ class TemplateValidator:
 
         # Validate parent template
         try:
-            parent_source = parent_path.read_text(encoding="utf-8")
-            parent_ast = self.env.parse(parent_source, parent_name)
+            _, parent_ast = self._parse_template(parent_name)
             parent_blocks = self._extract_blocks(parent_ast)
 
             # Check if child blocks override existing parent blocks
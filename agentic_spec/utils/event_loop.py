@@ -0,0 +1,55 @@
+"""Event loop selection for the CLI's asyncio entry points.
+
+uvloop is an optional speedup. Without it, or on Windows where it is not
+available, commands run on the standard asyncio loop.
+"""
+
+import asyncio
+import atexit
+from collections.abc import Coroutine
+import contextlib
+import functools
+from typing import Any
+
+# Always passed to asyncio.Runner explicitly: with no factory the runner also
+# installs its loop as the thread's current loop, which code that manages its
+# own loops (such as pytest-asyncio) may then close under it
+try:
+    import uvloop
+
+    _loop_factory = uvloop.new_event_loop
+except ImportError:
+    _loop_factory = asyncio.new_event_loop
+
+
+@functools.cache
+def _get_runner() -> asyncio.Runner:
+    """Return the process-wide runner, creating it on first use.
+
+    One runner is shared so commands that run several coroutines reuse a
+    loop instead of building one each time; it is closed at exit.
+    """
+    runner = asyncio.Runner(loop_factory=_loop_factory)
+    atexit.register(_close_runner, runner)
+    return runner
+
+
+def _close_runner(runner: asyncio.Runner) -> None:
+    """Close the shared runner at exit.
+
+    ``Runner.close`` joins the loop's default executor from a new thread,
+    which can no longer be started this late in shutdown. The loop is still
+    closed, and concurrent.futures joins the executor's workers itself.
+    """
+    with contextlib.suppress(RuntimeError):
+        runner.close()
+
+
+def run_async[T](main: Coroutine[Any, Any, T]) -> T:
+    """Run ``main`` to completion on the shared event loop, like ``asyncio.run``.
+
+    The loop is passed to the runner as a factory rather than installed as a
+    global policy, so library users and the test suite keep their own loop
+    choice.
+    """
+    return _get_runner().run(main)
@@ -0,0 +1,44 @@
+"""Fast JSON encoding and decoding with optional accelerators.
+
+orjson is an optional speedup. Without it the Rust encoder that ships with
+pydantic is used, and the standard library only as a last resort. All three
+decoders raise a ``ValueError`` subclass on malformed input.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def json_dumps(value: Any) -> str:
+        """Serialize ``value`` to a compact JSON string."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def json_dumps_pretty(value: Any) -> str:
+        """Serialize ``value`` to JSON indented by two spaces, for display."""
+        return orjson.dumps(
+            value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        ).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    try:
+        import pydantic_core
+
+        def json_dumps(value: Any) -> str:
+            """Serialize ``value`` to a compact JSON string."""
+            return pydantic_core.to_json(value).decode()
+
+        def json_dumps_pretty(value: Any) -> str:
+            """Serialize ``value`` to JSON indented by two spaces, for display."""
+            return pydantic_core.to_json(value, indent=2).decode()
+
+        json_loads = pydantic_core.from_json
+    except ImportError:
+        json_dumps = json.dumps
+        json_loads = json.loads
+
+        def json_dumps_pretty(value: Any) -> str:
+            """Serialize ``value`` to JSON indented by two spaces, for display."""
+            return json.dumps(value, indent=2)
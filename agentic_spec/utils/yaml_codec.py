@@ -0,0 +1,14 @@
+"""Safe YAML dumper and loader backed by libyaml when available.
+
+PyYAML only ships the C classes when it was built against libyaml; otherwise
+the pure-Python safe classes are used. Both handle plain data (dicts, lists,
+strings, numbers, booleans and ``None``) identically.
+"""
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+__all__ = ["SafeDumper", "SafeLoader"]
@@ -4,6 +4,7 @@ This module provides a FastAPI-based web interface for browsing specifications,
 tasks, and workflow status stored in the SQLite database.
 """
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
 
@@ -12,13 +13,12 @@ from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from .async_db import AsyncSpecManager, SQLiteBackend
+from .async_db import DEFAULT_DB_PATH, AsyncSpecManager, SQLiteBackend
 from .models import (
-    SpecificationDB,
+    DONE_TASK_STATUSES,
     TaskDB,
     TaskStatus,
     WorkflowStatus,
-    WorkLogDB,
 )
 
 # Initialize FastAPI app
@@ -40,17 +40,13 @@ templates.env.globals["now"] = datetime.now
 
 async def build_nav_stats(manager: AsyncSpecManager) -> dict[str, int]:
     """Aggregate quick stats for primary navigation badges (spec and task counts)."""
-    specs: list[SpecificationDB] = await manager.backend.list_specifications()
+    specs = await manager.backend.list_specifications_with_tasks()
     total_specs = len(specs)
     pending_specs = sum(1 for s in specs if not s.is_completed)
 
-    tasks: list[TaskDB] = []
-    for spec in specs:
-        tasks.extend(await manager.backend.get_tasks_for_spec(spec.id))
+    tasks: list[TaskDB] = [task for spec in specs for task in spec.tasks]
 
-    pending_tasks = sum(
-        1 for t in tasks if t.status not in {TaskStatus.COMPLETED, TaskStatus.APPROVED}
-    )
+    pending_tasks = sum(1 for t in tasks if t.status not in DONE_TASK_STATUSES)
 
     return {
         "total_specs": total_specs,
@@ -108,7 +104,7 @@ if STATIC_DIR.exists():
     app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
 # Global database path (can be configured)
-DB_PATH = Path("specs/specifications.db")
+DB_PATH = DEFAULT_DB_PATH
 
 
 async def get_db_manager() -> AsyncSpecManager:
@@ -204,9 +200,7 @@ async def view_specification(request: Request, spec_id: str):
 
         # Calculate completion percentage
         total_tasks = len(tasks)
-        completed_tasks = sum(
-            1 for t in tasks if t.status in [TaskStatus.COMPLETED, TaskStatus.APPROVED]
-        )
+        completed_tasks = sum(1 for t in tasks if t.status in DONE_TASK_STATUSES)
         completion_percentage = (
             (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         )
@@ -262,17 +256,15 @@ async def list_tasks(
         if spec_id:
             candidate_tasks = await manager.backend.get_tasks_for_spec(spec_id)
         else:
-            # Load tasks from every specification (could be optimised later)
-            specs: list[SpecificationDB] = await manager.backend.list_specifications()
+            # Load every specification together with its tasks
+            specs = await manager.backend.list_specifications_with_tasks()
 
             # If project filter supplied, narrow specs list by metadata.project
             if project:
                 specs = [s for s in specs if s.context.get("project") == project]
 
-            # Fetch tasks for each remaining spec
             for spec in specs:
-                spec_tasks = await manager.backend.get_tasks_for_spec(spec.id)
-                candidate_tasks.extend(spec_tasks)
+                candidate_tasks.extend(spec.tasks)
 
         # Apply status filter
         if status:
@@ -315,18 +307,17 @@ async def view_task(request: Request, task_id: str):
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
 
-        # Get approvals for this task
-        approvals = await manager.backend.get_approvals_for_task(task_id)
-
-        # Fetch work-log entries (timeline) – newest first
-        work_logs: list[WorkLogDB] = await manager.backend.get_work_logs(
-            task_id=task_id,
-            limit=100,  # safety cap
+        # Approvals, work-log entries (timeline, newest first) and the parent
+        # specification are independent, so fetch them concurrently
+        approvals, work_logs, spec = await asyncio.gather(
+            manager.backend.get_approvals_for_task(task_id),
+            manager.backend.get_work_logs(
+                task_id=task_id,
+                limit=100,  # safety cap
+            ),
+            manager.get_specification(task.spec_id),
         )
 
-        # Get the parent specification
-        spec = await manager.get_specification(task.spec_id)
-
         ctx = base_context(request, title=f"Task {task.id}")
         ctx.update(
             {
@@ -401,11 +392,7 @@ async def get_workflow_visualization(spec_id: str):
         # Task breakdown by status
         task_stats = {
             "total": len(tasks),
-            "completed": sum(
-                1
-                for t in tasks
-                if t.status in [TaskStatus.COMPLETED, TaskStatus.APPROVED]
-            ),
+            "completed": sum(1 for t in tasks if t.status in DONE_TASK_STATUSES),
             "in_progress": sum(1 for t in tasks if t.status == TaskStatus.IN_PROGRESS),
             "blocked": sum(1 for t in tasks if t.status == TaskStatus.BLOCKED),
             "pending": sum(1 for t in tasks if t.status == TaskStatus.PENDING),
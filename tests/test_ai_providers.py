@@ -0,0 +1,543 @@
+"""Tests for AI provider implementations."""
+
+import asyncio
+import subprocess
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agentic_spec.ai_providers import AIProviderFactory, OpenAIProvider
+from agentic_spec.ai_providers.base import run_sync
+from agentic_spec.ai_providers.cache import ResponseCache
+from agentic_spec.config import AIProviderConfig
+from agentic_spec.exceptions import AIServiceError, ConfigurationError
+
+
+@pytest.fixture
+def provider():
+    """Create an OpenAI provider with a dummy API key."""
+    return OpenAIProvider({"api_key": "test-key", "max_concurrency": 2})
+
+
+class TestGenerateResponsesBatch:
+    """Test batched response generation."""
+
+    @pytest.mark.asyncio
+    async def test_batch_preserves_order(self, provider):
+        """Test that results come back in prompt order."""
+
+        async def fake_generate(prompt, **kwargs):
+            return prompt.upper()
+
+        with patch.object(
+            OpenAIProvider, "generate_response", side_effect=fake_generate
+        ) as mock_generate:
+            results = await provider.generate_responses_batch(["a", "b", "c"])
+
+        assert results == ["A", "B", "C"]
+        assert mock_generate.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_returns_exceptions_in_place(self, provider):
+        """Test that a failing prompt does not abort the batch."""
+
+        async def fake_generate(prompt, **kwargs):
+            if prompt == "bad":
+                raise AIServiceError("boom")
+            return prompt
+
+        with patch.object(
+            OpenAIProvider, "generate_response", side_effect=fake_generate
+        ):
+            results = await provider.generate_responses_batch(["ok", "bad"])
+
+        assert results[0] == "ok"
+        assert isinstance(results[1], AIServiceError)
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_provider_concurrency_limit(self, provider):
+        """Test that in-flight requests never exceed max_concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_create(*args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "ok"
+
+        with patch.object(OpenAIProvider, "_create_response", side_effect=fake_create):
+            results = await provider.generate_responses_batch(["p"] * 6)
+
+        assert results == ["ok"] * 6
+        assert peak == 2
+
+
+class TestResponseCache:
+    """Test the LRU+TTL response cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted when full."""
+        cache = ResponseCache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_expired_entries_are_dropped(self):
+        """Test that entries past their TTL are treated as missing."""
+        cache = ResponseCache(ttl_s=10)
+        with patch("agentic_spec.ai_providers.cache.time.monotonic", return_value=0):
+            cache.set("a", "1")
+        with patch("agentic_spec.ai_providers.cache.time.monotonic", return_value=11):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_key_depends_on_all_parameters(self):
+        """Test that differing request parameters produce different keys."""
+        key = ResponseCache.make_key("m", "sys", "p", 0.0, None)
+        assert key == ResponseCache.make_key("m", "sys", "p", 0.0, None)
+        assert key != ResponseCache.make_key("m", "sys", "p", 0.0, [{"type": "x"}])
+        assert key != ResponseCache.make_key("m", None, "p", 0.0, None)
+
+
+class TestGenerateResponseCaching:
+    """Test response caching in the OpenAI provider."""
+
+    @pytest.mark.asyncio
+    async def test_deterministic_requests_are_cached(self, provider):
+        """Test that temperature 0 requests hit the API only once."""
+        with patch.object(
+            OpenAIProvider, "_create_response", return_value="spec"
+        ) as mock_create:
+            first = await provider.generate_response("prompt", temperature=0.0)
+            second = await provider.generate_response("prompt", temperature=0.0)
+
+        assert first == second == "spec"
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_are_not_cached(self, provider):
+        """Test that non-zero temperature always calls the API."""
+        with patch.object(
+            OpenAIProvider, "_create_response", return_value="spec"
+        ) as mock_create:
+            await provider.generate_response("prompt", temperature=0.7)
+            await provider.generate_response("prompt", temperature=0.7)
+
+        assert mock_create.await_count == 2
+
+
+class TestResponsesApiInput:
+    """Test request shaping for the Responses API path."""
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_sent_as_separate_message(self, provider):
+        """Test that the system prompt is a stable leading message."""
+        provider.client = MagicMock()
+        provider.client.responses.create = AsyncMock(
+            return_value=MagicMock(output_text="ok")
+        )
+
+        result = await provider.generate_response(
+            "user prompt",
+            system_prompt="system prompt",
+            tools=[{"type": "web_search_preview"}],
+        )
+
+        assert result == "ok"
+        kwargs = provider.client.responses.create.await_args.kwargs
+        assert kwargs["input"] == [
+            {"role": "system", "content": "system prompt"},
+            {"role": "user", "content": "user prompt"},
+        ]
+        assert len(kwargs["prompt_cache_key"]) == 32
+
+    @pytest.mark.asyncio
+    async def test_chat_messages_without_system_prompt(self, provider):
+        """Test that only a user message is sent when no system prompt is set."""
+        completion = MagicMock()
+        completion.choices[0].message.content = "ok"
+        provider.client = MagicMock()
+        provider.client.chat.completions.create = AsyncMock(return_value=completion)
+
+        assert await provider.generate_response("user prompt") == "ok"
+        kwargs = provider.client.chat.completions.create.await_args.kwargs
+        assert kwargs["messages"] == [{"role": "user", "content": "user prompt"}]
+
+    @pytest.mark.asyncio
+    async def test_chat_request_records_prompt_cache_usage(self, provider):
+        """Test that chat requests carry a cache key and record cached tokens."""
+        completion = MagicMock()
+        completion.choices[0].message.content = "ok"
+        completion.usage.prompt_tokens = 2000
+        completion.usage.prompt_tokens_details.cached_tokens = 1536
+        provider.client = MagicMock()
+        provider.client.chat.completions.create = AsyncMock(return_value=completion)
+        before = OpenAIProvider.cache_stats()
+
+        await provider.generate_response("user prompt", system_prompt="system")
+
+        kwargs = provider.client.chat.completions.create.await_args.kwargs
+        assert len(kwargs["prompt_cache_key"]) == 32
+        after = OpenAIProvider.cache_stats()
+        assert after["requests"] == before["requests"] + 1
+        assert after["prompt_tokens"] == before["prompt_tokens"] + 2000
+        assert after["cached_tokens"] == before["cached_tokens"] + 1536
+
+    @pytest.mark.asyncio
+    async def test_no_prompt_concatenation_on_responses_path(self, provider):
+        """Test that prompts are never joined into one input string."""
+        provider.client = MagicMock()
+        provider.client.responses.create = AsyncMock(
+            return_value=MagicMock(output_text="ok")
+        )
+        system_prompt = "s" * 4096
+
+        for prompt in ["first", "second"]:
+            await provider.generate_response(
+                prompt, system_prompt=system_prompt, tools=[{"type": "x"}]
+            )
+
+        calls = provider.client.responses.create.await_args_list
+        assert calls[0].kwargs["input"][0]["content"] is system_prompt
+        assert (
+            calls[0].kwargs["prompt_cache_key"] == calls[1].kwargs["prompt_cache_key"]
+        )
+
+
+class TestClientLifecycle:
+    """Test HTTP client construction and cleanup."""
+
+    def test_max_retries_from_config(self):
+        """Test that transient-error retries are configurable."""
+        provider = OpenAIProvider({"api_key": "test-key", "max_retries": 5})
+        assert provider.client.max_retries == 5
+
+    def test_provider_class_has_no_abc_metaclass(self):
+        """Test that providers are plain classes rather than ABCs."""
+        assert type(OpenAIProvider) is type
+
+    def test_provider_uses_slots(self, provider):
+        """Test that provider instances do not carry a per-instance dict."""
+        assert not hasattr(provider, "__dict__")
+
+    def test_max_retries_default(self, provider):
+        """Test the default retry budget for transient errors."""
+        assert provider.client.max_retries == 3
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_client(self, provider):
+        """Test that aclose releases the underlying client."""
+        provider.client = MagicMock()
+        provider.client.close = AsyncMock()
+
+        await provider.aclose()
+
+        provider.client.close.assert_awaited_once()
+
+
+class TestModelSelection:
+    """Test default and available model lookup."""
+
+    def test_default_model_from_config(self):
+        """Test that the configured default model is used."""
+        provider = OpenAIProvider({"api_key": "test-key", "default_model": "gpt-4o"})
+        assert provider.get_default_model() == "gpt-4o"
+
+    def test_default_model_when_unset(self):
+        """Test the fallback when the config carries default_model=None."""
+        provider = OpenAIProvider({"api_key": "test-key", "default_model": None})
+        assert provider.get_default_model() == "gpt-4o-mini"
+
+    def test_available_models_are_shared(self, provider):
+        """Test that the model list is an immutable shared constant."""
+        models = provider.get_available_models()
+        assert "gpt-4.1" in models
+        assert models is provider.get_available_models()
+
+
+class TestAvailability:
+    """Test provider availability checks."""
+
+    def test_available_with_config_key(self, provider):
+        """Test that a configured API key makes the provider available."""
+        assert provider.is_available is True
+
+    def test_availability_is_resolved_once(self, provider):
+        """Test that is_available does not re-read the environment."""
+        with patch("agentic_spec.ai_providers.openai_provider.os.getenv") as getenv:
+            assert provider.is_available is True
+        getenv.assert_not_called()
+
+
+class TestProviderFactory:
+    """Test provider construction through the factory."""
+
+    def test_provider_type_is_normalized(self):
+        """Test that provider types are matched case-insensitively."""
+        config = AIProviderConfig(provider_type=" OpenAI ", api_key="test-key")
+
+        assert config.provider_type == "openai"
+        assert isinstance(AIProviderFactory.create_provider(config), OpenAIProvider)
+
+    def test_unknown_provider_type(self):
+        """Test that unregistered provider types are rejected."""
+        with pytest.raises(ConfigurationError, match="Unknown AI provider type"):
+            AIProviderFactory.create_provider(AIProviderConfig(provider_type="nope"))
+
+    def test_missing_api_key_fails_before_client_is_built(self, monkeypatch):
+        """Test that invalid configs are rejected without building a client."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+        with (
+            patch.object(OpenAIProvider, "build_client") as build_client,
+            pytest.raises(ConfigurationError, match="API key not provided"),
+        ):
+            AIProviderFactory.create_provider(AIProviderConfig(provider_type="openai"))
+
+        build_client.assert_not_called()
+
+    def test_config_is_validated_once(self):
+        """Test that creating a provider validates its config exactly once."""
+        config = AIProviderConfig(provider_type="openai", api_key="test-key")
+
+        with patch.object(
+            OpenAIProvider, "validate_config", wraps=OpenAIProvider.validate_config
+        ) as validate_config:
+            AIProviderFactory.create_provider(config)
+
+        validate_config.assert_called_once()
+
+
+class TestClientPool:
+    """Test sharing of API clients between factory-created providers."""
+
+    @pytest.fixture(autouse=True)
+    def empty_pool(self):
+        """Isolate each test from clients pooled by other tests."""
+        AIProviderFactory._client_pools.clear()
+        yield
+        AIProviderFactory._client_pools.clear()
+
+    @pytest.mark.asyncio
+    async def test_same_settings_share_client(self):
+        """Test that identical connection settings reuse one client."""
+        config = AIProviderConfig(provider_type="openai", api_key="test-key")
+
+        first = AIProviderFactory.create_provider(config)
+        second = AIProviderFactory.create_provider(config)
+
+        assert first is not second
+        assert first.client is second.client
+
+    @pytest.mark.asyncio
+    async def test_pooled_config_is_validated_once(self):
+        """Test that providers sharing a pooled client are validated once each."""
+        config = AIProviderConfig(provider_type="openai", api_key="test-key")
+
+        with patch.object(
+            OpenAIProvider, "validate_config", wraps=OpenAIProvider.validate_config
+        ) as validate_config:
+            AIProviderFactory.create_provider(config)
+            AIProviderFactory.create_provider(config)
+
+        assert validate_config.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_different_settings_get_separate_clients(self):
+        """Test that different API keys do not share a client."""
+        first = AIProviderFactory.create_provider(
+            AIProviderConfig(provider_type="openai", api_key="key-a")
+        )
+        second = AIProviderFactory.create_provider(
+            AIProviderConfig(provider_type="openai", api_key="key-b")
+        )
+
+        assert first.client is not second.client
+
+    def test_clients_are_not_shared_across_event_loops(self):
+        """Test that each event loop gets its own pooled client."""
+        config = AIProviderConfig(provider_type="openai", api_key="test-key")
+
+        async def create():
+            return AIProviderFactory.create_provider(config).client
+
+        first = asyncio.run(create())
+        second = asyncio.run(create())
+
+        assert first is not second
+        # The first loop is closed, so its pool has been dropped
+        assert len(AIProviderFactory._client_pools) == 1
+
+    def test_no_pooling_outside_event_loop(self):
+        """Test that providers built without a running loop own their client."""
+        config = AIProviderConfig(provider_type="openai", api_key="test-key")
+
+        first = AIProviderFactory.create_provider(config)
+        second = AIProviderFactory.create_provider(config)
+
+        assert first.client is not second.client
+        assert AIProviderFactory._client_pools == {}
+
+    @pytest.mark.asyncio
+    async def test_close_all_empties_pool(self):
+        """Test that close_all closes the running loop's pooled clients."""
+        client = MagicMock()
+        client.close = AsyncMock()
+        AIProviderFactory._client_pools[asyncio.get_running_loop()] = {
+            ("openai",): client
+        }
+
+        await AIProviderFactory.close_all()
+
+        client.close.assert_awaited_once()
+        assert AIProviderFactory._client_pools == {}
+
+    @pytest.mark.asyncio
+    async def test_provider_does_not_close_shared_client(self):
+        """Test that aclose leaves pooled clients open."""
+        provider = AIProviderFactory.create_provider(
+            AIProviderConfig(provider_type="openai", api_key="test-key")
+        )
+        provider.client.close = AsyncMock()
+
+        await provider.aclose()
+
+        provider.client.close.assert_not_awaited()
+
+
+def test_import_does_not_load_openai_sdk():
+    """Test that importing the package defers loading the openai SDK."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, agentic_spec; sys.exit('openai' in sys.modules)",
+        ],
+        check=False,
+    )
+    assert result.returncode == 0
+
+
+class TestTelemetry:
+    """Test request latency and usage instrumentation."""
+
+    @pytest.mark.asyncio
+    async def test_latencies_not_recorded_by_default(self, provider):
+        """Test that the default path skips instrumentation."""
+        with patch.object(OpenAIProvider, "_create_response", return_value="ok"):
+            await provider.generate_response("prompt")
+
+        assert provider.recent_latencies_ms() == []
+
+    @pytest.mark.asyncio
+    async def test_latencies_recorded_when_enabled(self):
+        """Test that enabling telemetry records per-request latency."""
+        provider = OpenAIProvider({"api_key": "test-key", "enable_telemetry": True})
+
+        with patch.object(OpenAIProvider, "_create_response", return_value="ok"):
+            await provider.generate_response("first")
+            await provider.generate_response("second")
+
+        latencies = provider.recent_latencies_ms()
+        assert len(latencies) == 2
+        assert all(latency >= 0 for latency in latencies)
+
+
+class TestSyncFacade:
+    """Test the synchronous wrapper around generate_response."""
+
+    def test_sync_calls_share_one_loop(self, provider):
+        """Test that repeated sync calls reuse one event loop."""
+        loops = []
+
+        async def fake_create(*args):
+            loops.append(asyncio.get_running_loop())
+            return "ok"
+
+        with patch.object(OpenAIProvider, "_create_response", side_effect=fake_create):
+            assert provider.generate_response_sync("first") == "ok"
+            assert provider.generate_response_sync("second") == "ok"
+
+        assert loops[0] is loops[1]
+
+    def test_run_sync_propagates_exceptions(self):
+        """Test that errors raised by the coroutine reach the caller."""
+
+        async def fail():
+            raise AIServiceError("boom")
+
+        with pytest.raises(AIServiceError):
+            run_sync(fail())
+
+    @pytest.mark.asyncio
+    async def test_run_sync_rejects_running_loop(self):
+        """Test that run_sync refuses to block a running event loop."""
+
+        async def noop():
+            return None
+
+        with pytest.raises(RuntimeError, match="running event loop"):
+            run_sync(noop())
+
+    def test_shared_loop_closes_quietly_at_exit(self):
+        """Test that exiting after a thread offload prints no shutdown error."""
+        code = (
+            "import asyncio\n"
+            "from agentic_spec.ai_providers.base import run_sync\n"
+            "run_sync(asyncio.to_thread(int))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0
+        assert result.stderr == ""
+
+
+class TestGenerateResponseStream:
+    """Test streamed response generation."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_content_deltas(self, provider):
+        """Test that streamed chunks are yielded as they arrive."""
+
+        def make_chunk(content):
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = content
+            return chunk
+
+        async def fake_stream():
+            for content in ["Hello", None, " world"]:
+                yield make_chunk(content)
+
+        provider.client = MagicMock()
+        provider.client.chat.completions.create = AsyncMock(return_value=fake_stream())
+
+        chunks = [chunk async for chunk in provider.generate_response_stream("hi")]
+
+        assert chunks == ["Hello", " world"]
+        kwargs = provider.client.chat.completions.create.await_args.kwargs
+        assert kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_stream_wraps_api_errors(self, provider):
+        """Test that API failures surface as AIServiceError."""
+        provider.client = MagicMock()
+        provider.client.chat.completions.create = AsyncMock(
+            side_effect=RuntimeError("down")
+        )
+
+        with pytest.raises(AIServiceError):
+            async for _ in provider.generate_response_stream("hi"):
+                pass
@@ -1,25 +1,33 @@
 """Tests for async database layer functionality."""
 
-from datetime import datetime, timedelta
+import asyncio
+import builtins
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 import shutil
+import sqlite3
 import tempfile
+from unittest.mock import AsyncMock
+import uuid
 
 import pytest
 import pytest_asyncio
 
-# Configure pytest-asyncio
-pytestmark = pytest.mark.asyncio
-
 from agentic_spec.async_db import (
     AsyncSpecManager,
     DatabaseBackend,
     SQLiteBackend,
+    _dumps_list,
+    _loads_list,
+    _now,
+    _uuid4_batch,
+    _work_logs_sql,
 )
 from agentic_spec.exceptions import ConfigurationError, DatabaseError
 from agentic_spec.models import (
     ApprovalDB,
     ApprovalLevel,
+    ApprovalRecord,
     ImplementationStep,
     ProgrammingSpec,
     SpecContext,
@@ -28,8 +36,11 @@ from agentic_spec.models import (
     SpecRequirement,
     SpecStatus,
     TaskDB,
+    TaskProgress,
     TaskStatus,
+    WorkflowStatus,
     WorkLogDB,
+    WorkLogEntry,
 )
 
 
@@ -74,8 +85,8 @@ class TestSQLiteBackend:
             id="test-spec-123",
             title="Test Specification",
             inherits=[],
-            created=datetime.now(),
-            updated=datetime.now(),
+            created=_now(),
+            updated=_now(),
             version="1.0",
             status=SpecStatus.DRAFT,
             parent_spec_id=None,
@@ -108,6 +119,7 @@ class TestSQLiteBackend:
             blockers=[],
         )
 
+    @pytest.mark.asyncio
     async def test_initialize_creates_tables(self, temp_backend):
         """Test that initialize creates necessary tables."""
         # Verify tables exist by trying to query them
@@ -121,6 +133,224 @@ class TestSQLiteBackend:
         for table in expected_tables:
             assert table in table_names
 
+    @pytest.mark.asyncio
+    async def test_initialize_applies_pragmas(self, temp_backend):
+        """Test that initialize enables WAL and the per-connection PRAGMAs."""
+        async with temp_backend.connection.execute("PRAGMA journal_mode") as cursor:
+            assert (await cursor.fetchone())[0] == "wal"
+        async with temp_backend.connection.execute("PRAGMA synchronous") as cursor:
+            assert (await cursor.fetchone())[0] == 1  # NORMAL
+        async with temp_backend.connection.execute("PRAGMA busy_timeout") as cursor:
+            assert (await cursor.fetchone())[0] == 5000
+
+    @pytest.mark.parametrize(
+        ("sql", "index"),
+        [
+            (
+                "SELECT * FROM tasks WHERE spec_id = ? ORDER BY step_index",
+                "idx_tasks_spec_step",
+            ),
+            (
+                (
+                    "SELECT * FROM specifications WHERE workflow_status = ? "
+                    "ORDER BY priority, updated DESC"
+                ),
+                "idx_specs_wf_prio_updated",
+            ),
+            (
+                (
+                    "SELECT * FROM tasks WHERE assigned_to = ? "
+                    "ORDER BY priority, started_at"
+                ),
+                "idx_tasks_assignee_prio",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_composite_indexes_avoid_sort(self, temp_backend, sql, index):
+        """Test that hot queries filter and sort through one composite index."""
+        async with temp_backend.connection.execute(
+            f"EXPLAIN QUERY PLAN {sql}", ("x",)
+        ) as cursor:
+            plan = " ".join(row["detail"] for row in await cursor.fetchall())
+
+        assert index in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.parametrize(
+        ("sql", "index"),
+        [
+            ("SELECT id FROM tasks WHERE is_completed = 1", "idx_tasks_completed"),
+            (
+                "SELECT id FROM tasks WHERE blocked_at IS NOT NULL",
+                "idx_tasks_blocked",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_partial_indexes_used(self, temp_backend, sql, index):
+        """Test that sparse flag and timestamp lookups use the partial indexes."""
+        async with temp_backend.connection.execute(
+            f"EXPLAIN QUERY PLAN {sql}"
+        ) as cursor:
+            plan = " ".join(row["detail"] for row in await cursor.fetchall())
+
+        assert index in plan
+
+    @pytest.mark.asyncio
+    async def test_initialize_is_idempotent(self, temp_backend):
+        """Test that a second initialize keeps the open connections."""
+        connection = temp_backend.connection
+        async with temp_backend._acquire_reader():
+            pass
+
+        await temp_backend.initialize()
+
+        assert temp_backend.connection is connection
+        assert len(temp_backend._reader_connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_initialize_skips_ddl_for_current_schema(self, tmp_path):
+        """Test that reopening an up-to-date database does not rerun the DDL."""
+        first = SQLiteBackend(tmp_path / "test.db")
+        await first.initialize()
+        await first.close()
+
+        second = SQLiteBackend(tmp_path / "test.db")
+        second._create_tables = AsyncMock()
+        await second.initialize()
+        try:
+            second._create_tables.assert_not_awaited()
+            async with second.connection.execute("PRAGMA user_version") as cursor:
+                assert (await cursor.fetchone())[0] >= 1
+        finally:
+            await second.close()
+
+    @pytest.mark.asyncio
+    async def test_create_tables_runs_schema_script(self, temp_backend):
+        """Test that the schema script creates the indexes and planner stats."""
+        async with temp_backend.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger')"
+        ) as cursor:
+            names = {row["name"] for row in await cursor.fetchall()}
+        async with temp_backend.connection.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ) as cursor:
+            has_stats = await cursor.fetchone() is not None
+
+        assert {"idx_tasks_spec_step", "trg_spec_tags_insert"} <= names
+        assert "idx_tasks_spec_id" not in names
+        assert has_stats
+        assert not temp_backend.connection.in_transaction
+
+    @pytest.mark.asyncio
+    async def test_failed_schema_script_rolls_back(self, tmp_path, monkeypatch):
+        """Test that a failing schema script leaves no transaction open."""
+        monkeypatch.setattr(
+            "agentic_spec.async_db._SCHEMA_DDL",
+            "BEGIN; CREATE TABLE partial (id TEXT); NOT SQL; COMMIT;",
+        )
+        backend = SQLiteBackend(tmp_path / "test.db")
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                await backend.initialize()
+            assert not backend.connection.in_transaction
+            async with backend.connection.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'partial'"
+            ) as cursor:
+                assert await cursor.fetchone() is None
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_pragma_overrides(self, tmp_path):
+        """Test that pragmas passed to the constructor override the defaults."""
+        backend = SQLiteBackend(tmp_path / "test.db", pragmas={"foreign_keys": "ON"})
+        await backend.initialize()
+        try:
+            async with backend.connection.execute("PRAGMA foreign_keys") as cursor:
+                assert (await cursor.fetchone())[0] == 1
+            assert backend.pragmas["journal_mode"] == "WAL"
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_connections_use_row_factory(self, temp_backend):
+        """Test that the writer and readers return sqlite3.Row objects."""
+        assert temp_backend.connection.row_factory is sqlite3.Row
+        async with temp_backend._acquire_reader() as conn:
+            assert conn.row_factory is sqlite3.Row
+            async with conn.execute("SELECT 1 AS one") as cursor:
+                assert (await cursor.fetchone())["one"] == 1
+
+    @pytest.mark.asyncio
+    async def test_statement_cache_size(self, tmp_path, sample_spec_db):
+        """Test that a custom statement cache size is accepted."""
+        backend = SQLiteBackend(tmp_path / "test.db", statement_cache_size=16)
+        await backend.initialize()
+        try:
+            assert backend.statement_cache_size == 16
+            await backend.create_specification(sample_spec_db)
+            assert await backend.get_specification(sample_spec_db.id) is not None
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_reads_use_reader_pool(self, temp_backend, sample_spec_db):
+        """Test that reads run on pooled reader connections."""
+        assert temp_backend._reader_connections == []
+
+        async with temp_backend._acquire_reader() as conn:
+            assert conn is not temp_backend.connection
+            assert temp_backend._readers.qsize() == 0
+        assert temp_backend._readers.qsize() == 1
+
+        # The released reader is reused rather than a new one opened
+        async with temp_backend._acquire_reader() as again:
+            assert again is conn
+
+        await temp_backend.create_specification(sample_spec_db)
+        assert await temp_backend.get_specification(sample_spec_db.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_reader_pool_grows_to_read_pool_size(self, tmp_path):
+        """Test that concurrent reads open at most read_pool_size readers."""
+        backend = SQLiteBackend(tmp_path / "test.db", read_pool_size=2)
+        await backend.initialize()
+        try:
+
+            async def hold_reader():
+                async with backend._acquire_reader():
+                    await asyncio.sleep(0.01)
+
+            await asyncio.gather(*(hold_reader() for _ in range(5)))
+            assert len(backend._reader_connections) == 2
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_reads_inside_transaction_see_uncommitted_writes(
+        self, temp_backend, sample_spec_db
+    ):
+        """Test that reads during a transaction use the writer connection."""
+        async with temp_backend.transaction():
+            await temp_backend.create_specification(sample_spec_db)
+            assert await temp_backend.get_specification(sample_spec_db.id)
+
+    @pytest.mark.asyncio
+    async def test_read_pool_disabled(self, tmp_path, sample_spec_db):
+        """Test that read_pool_size=0 routes every query to the writer."""
+        backend = SQLiteBackend(tmp_path / "test.db", read_pool_size=0)
+        await backend.initialize()
+        try:
+            async with backend._acquire_reader() as conn:
+                assert conn is backend.connection
+            await backend.create_specification(sample_spec_db)
+            assert await backend.get_specification(sample_spec_db.id) is not None
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
     async def test_create_and_get_specification(self, temp_backend, sample_spec_db):
         """Test creating and retrieving a specification."""
         # Create specification
@@ -134,11 +364,52 @@ class TestSQLiteBackend:
         assert retrieved_spec.title == sample_spec_db.title
         assert retrieved_spec.status == sample_spec_db.status
 
+    @pytest.mark.asyncio
+    async def test_create_without_returning_support(self, temp_backend, sample_spec_db):
+        """Test the INSERT path used on SQLite versions without RETURNING."""
+        temp_backend._supports_returning = False
+
+        spec_id = await temp_backend.create_specification(sample_spec_db)
+        assert spec_id == sample_spec_db.id
+        assert await temp_backend.get_specification(spec_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_timestamps_decoded_by_connection(self, temp_backend, sample_spec_db):
+        """Test that TIMESTAMP columns come back as datetimes."""
+        await temp_backend.create_specification(sample_spec_db)
+
+        async with temp_backend.connection.execute(
+            "SELECT created, completed_at FROM specifications WHERE id = ?",
+            (sample_spec_db.id,),
+        ) as cursor:
+            row = await cursor.fetchone()
+
+        assert row["created"] == sample_spec_db.created
+        assert row["completed_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_tracking_fields_round_trip(self, temp_backend, sample_spec_db):
+        """Test that the enhanced tracking columns are decoded."""
+        assert temp_backend._has_tracking_columns
+        sample_spec_db.priority = 2
+        sample_spec_db.tags = ["api"]
+        sample_spec_db.created_by = "tester"
+        await temp_backend.create_specification(sample_spec_db)
+
+        spec = await temp_backend.get_specification(sample_spec_db.id)
+
+        assert spec.priority == 2
+        assert spec.tags == ["api"]
+        assert spec.created_by == "tester"
+        assert spec.last_updated_by == "system"
+
+    @pytest.mark.asyncio
     async def test_get_nonexistent_specification(self, temp_backend):
         """Test retrieving a non-existent specification."""
         result = await temp_backend.get_specification("nonexistent")
         assert result is None
 
+    @pytest.mark.asyncio
     async def test_update_specification(self, temp_backend, sample_spec_db):
         """Test updating a specification."""
         # Create specification
@@ -154,6 +425,104 @@ class TestSQLiteBackend:
         assert retrieved_spec.title == "Updated Title"
         assert retrieved_spec.status == SpecStatus.REVIEWED
 
+    @pytest.mark.asyncio
+    async def test_update_specifications_share_timestamp(
+        self, temp_backend, sample_spec_db
+    ):
+        """Test that a bulk update stores one shared updated timestamp."""
+        other = sample_spec_db.model_copy()
+        other.id = "test-spec-456"
+        await temp_backend.create_specifications([sample_spec_db, other])
+
+        updated_at = datetime(2030, 1, 1, 12, 0, tzinfo=UTC)
+        sample_spec_db.title = "Updated Title"
+        await temp_backend.update_specifications(
+            [sample_spec_db, other], updated_at=updated_at
+        )
+
+        first = await temp_backend.get_specification(sample_spec_db.id)
+        second = await temp_backend.get_specification(other.id)
+        assert first.title == "Updated Title"
+        assert first.updated == second.updated == updated_at
+
+    @pytest.mark.asyncio
+    async def test_get_specification_cached(self, temp_backend, sample_spec_db):
+        """Test that repeat lookups are served from the cache as copies."""
+        await temp_backend.create_specification(sample_spec_db)
+        first = await temp_backend.get_specification(sample_spec_db.id)
+        first.title = "Mutated by caller"
+
+        temp_backend._acquire_reader = None  # any query would now fail
+        second = await temp_backend.get_specification(sample_spec_db.id)
+
+        assert second.title == sample_spec_db.title
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_writes_evict_cached_lookups(
+        self, temp_backend, sample_spec_db, sample_task_db
+    ):
+        """Test that updates and deletes are visible to cached lookups."""
+        await temp_backend.create_specification(sample_spec_db)
+        await temp_backend.create_task(sample_task_db)
+        await temp_backend.get_specification(sample_spec_db.id)
+        await temp_backend.get_task(sample_task_db.id)
+
+        sample_spec_db.title = "Updated Title"
+        await temp_backend.update_specification(sample_spec_db)
+        sample_task_db.status = TaskStatus.IN_PROGRESS
+        await temp_backend.update_task(sample_task_db)
+
+        spec = await temp_backend.get_specification(sample_spec_db.id)
+        task = await temp_backend.get_task(sample_task_db.id)
+        assert spec.title == "Updated Title"
+        assert task.status == TaskStatus.IN_PROGRESS
+
+        await temp_backend.delete_task(sample_task_db.id)
+        assert await temp_backend.get_task(sample_task_db.id) is None
+
+    @pytest.mark.asyncio
+    async def test_update_specification_writes_back_to_cache(
+        self, temp_backend, sample_spec_db
+    ):
+        """Test that updating a cached spec refreshes the cached copy."""
+        await temp_backend.create_specification(sample_spec_db)
+        await temp_backend.get_specification(sample_spec_db.id)
+
+        sample_spec_db.title = "Written Back"
+        updated_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+        await temp_backend.update_specification(sample_spec_db, updated_at)
+
+        temp_backend._acquire_reader = None  # any query would now fail
+        spec = await temp_backend.get_specification(sample_spec_db.id)
+        assert spec.title == "Written Back"
+        assert spec.updated == updated_at
+
+    @pytest.mark.asyncio
+    async def test_specification_exists(self, temp_backend, sample_spec_db):
+        """Test the existence probe with and without a cached row."""
+        assert not await temp_backend.specification_exists(sample_spec_db.id)
+
+        await temp_backend.create_specification(sample_spec_db)
+        assert await temp_backend.specification_exists(sample_spec_db.id)
+        assert sample_spec_db.id not in temp_backend._spec_cache
+
+        await temp_backend.delete_specification(sample_spec_db.id)
+        assert not await temp_backend.specification_exists(sample_spec_db.id)
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, tmp_path, sample_spec_db):
+        """Test that cache_size=0 keeps nothing between lookups."""
+        backend = SQLiteBackend(tmp_path / "test.db", cache_size=0)
+        await backend.initialize()
+        try:
+            await backend.create_specification(sample_spec_db)
+            await backend.get_specification(sample_spec_db.id)
+            assert not backend._spec_cache
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
     async def test_delete_specification(self, temp_backend, sample_spec_db):
         """Test deleting a specification."""
         # Create specification
@@ -166,6 +535,7 @@ class TestSQLiteBackend:
         result = await temp_backend.get_specification(sample_spec_db.id)
         assert result is None
 
+    @pytest.mark.asyncio
     async def test_list_specifications(self, temp_backend, sample_spec_db):
         """Test listing specifications."""
         # Create multiple specifications
@@ -191,6 +561,49 @@ class TestSQLiteBackend:
         limited_specs = await temp_backend.list_specifications(limit=1)
         assert len(limited_specs) == 1
 
+    @pytest.mark.asyncio
+    async def test_list_specifications_keyset_pagination(
+        self, temp_backend, sample_spec_db
+    ):
+        """Test paging through specifications with the before cursor."""
+        specs = []
+        for i in range(5):
+            spec = sample_spec_db.model_copy()
+            spec.id = f"spec-{i}"
+            # Two specs share a timestamp to exercise the id tie-breaker
+            spec.created = sample_spec_db.created - timedelta(minutes=i // 2)
+            specs.append(spec)
+        await temp_backend.create_specifications(specs)
+
+        seen = []
+        page = await temp_backend.list_specifications(limit=2)
+        while page:
+            seen.extend(spec.id for spec in page)
+            last = page[-1]
+            page = await temp_backend.list_specifications(
+                limit=2, before=(last.created, last.id)
+            )
+
+        assert sorted(seen) == sorted(spec.id for spec in specs)
+        assert len(seen) == len(set(seen))
+
+    @pytest.mark.asyncio
+    async def test_get_specifications_by_tag(self, temp_backend, sample_spec_db):
+        """Test that tag lookups go through the trigger-maintained spec_tags table."""
+        tagged = sample_spec_db.model_copy()
+        tagged.tags = ["backend", "api"]
+        other = sample_spec_db.model_copy()
+        other.id = "test-spec-456"
+        other.tags = ["frontend"]
+        await temp_backend.create_specifications([tagged, other])
+
+        specs = await temp_backend.get_specifications_by_tag("api")
+        assert [s.id for s in specs] == [tagged.id]
+
+        await temp_backend.delete_specification(tagged.id)
+        assert await temp_backend.get_specifications_by_tag("api") == []
+
+    @pytest.mark.asyncio
     async def test_create_and_get_task(
         self, temp_backend, sample_spec_db, sample_task_db
     ):
@@ -209,6 +622,7 @@ class TestSQLiteBackend:
         assert retrieved_task.task == sample_task_db.task
         assert retrieved_task.status == sample_task_db.status
 
+    @pytest.mark.asyncio
     async def test_update_task_status(
         self, temp_backend, sample_spec_db, sample_task_db
     ):
@@ -219,7 +633,7 @@ class TestSQLiteBackend:
 
         # Update task
         sample_task_db.status = TaskStatus.IN_PROGRESS
-        sample_task_db.started_at = datetime.now()
+        sample_task_db.started_at = _now()
         sample_task_db.completion_notes = "Working on it"
         await temp_backend.update_task(sample_task_db)
 
@@ -229,6 +643,7 @@ class TestSQLiteBackend:
         assert retrieved_task.started_at is not None
         assert retrieved_task.completion_notes == "Working on it"
 
+    @pytest.mark.asyncio
     async def test_get_tasks_for_spec(self, temp_backend, sample_spec_db):
         """Test getting all tasks for a specification."""
         # Create specification
@@ -267,6 +682,141 @@ class TestSQLiteBackend:
         assert tasks[0].step_index == 0  # Should be ordered by step_index
         assert tasks[1].step_index == 1
 
+    @pytest.mark.asyncio
+    async def test_large_result_decoded_in_thread(
+        self, temp_backend, sample_spec_db, monkeypatch
+    ):
+        """Test that result sets above the threshold are decoded off the loop."""
+        monkeypatch.setattr("agentic_spec.async_db._DECODE_IN_THREAD_MIN_ROWS", 1)
+        specs = []
+        for i in range(3):
+            spec = sample_spec_db.model_copy()
+            spec.id = f"spec-{i}"
+            specs.append(spec)
+        await temp_backend.create_specifications(specs)
+
+        listed = await temp_backend.list_specifications()
+
+        assert sorted(s.id for s in listed) == ["spec-0", "spec-1", "spec-2"]
+
+    @pytest.mark.asyncio
+    async def test_list_specifications_with_tasks(
+        self, temp_backend, sample_spec_db, sample_task_db
+    ):
+        """Test that specifications are listed with their tasks attached."""
+        other_spec = sample_spec_db.model_copy()
+        other_spec.id = "test-spec-456"
+        second_task = sample_task_db.model_copy()
+        second_task.id = "task-456"
+        second_task.step_index = 1
+        await temp_backend.create_specifications([sample_spec_db, other_spec])
+        await temp_backend.create_tasks([second_task, sample_task_db])
+
+        specs = {s.id: s for s in await temp_backend.list_specifications_with_tasks()}
+
+        assert [t.id for t in specs[sample_spec_db.id].tasks] == [
+            "task-123",
+            "task-456",
+        ]
+        assert specs[other_spec.id].tasks == []
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_for_specs(
+        self, temp_backend, sample_spec_db, sample_task_db
+    ):
+        """Test batched task lookup, including specs without tasks."""
+        other_task = sample_task_db.model_copy()
+        other_task.id = "task-456"
+        other_task.spec_id = "test-spec-456"
+        other_spec = sample_spec_db.model_copy()
+        other_spec.id = "test-spec-456"
+        await temp_backend.create_specifications([sample_spec_db, other_spec])
+        await temp_backend.create_tasks([sample_task_db, other_task])
+
+        tasks_by_spec = await temp_backend.get_tasks_for_specs(
+            [sample_spec_db.id, other_spec.id, "missing"]
+        )
+
+        assert [t.id for t in tasks_by_spec[sample_spec_db.id]] == ["task-123"]
+        assert [t.id for t in tasks_by_spec[other_spec.id]] == ["task-456"]
+        assert tasks_by_spec["missing"] == []
+
+    @pytest.mark.asyncio
+    async def test_create_tasks_bulk(self, temp_backend, sample_spec_db):
+        """Test creating several tasks in one call."""
+        await temp_backend.create_specification(sample_spec_db)
+
+        tasks = [
+            TaskDB(
+                id=f"task-{i}",
+                spec_id=sample_spec_db.id,
+                step_index=i,
+                task=f"Task {i}",
+                details="Details",
+                files=[],
+                acceptance="Works",
+                estimated_effort="low",
+            )
+            for i in range(5)
+        ]
+
+        ids = await temp_backend.create_tasks(tasks)
+        assert ids == [task.id for task in tasks]
+
+        stored = await temp_backend.get_tasks_for_spec(sample_spec_db.id)
+        assert [task.id for task in stored] == ids
+
+    @pytest.mark.asyncio
+    async def test_create_work_logs_bulk_rolls_back_on_error(
+        self, temp_backend, sample_spec_db
+    ):
+        """Test that a failing bulk insert leaves no partial rows behind."""
+        await temp_backend.create_specification(sample_spec_db)
+
+        log = WorkLogDB(
+            id="log-1",
+            spec_id=sample_spec_db.id,
+            action="started",
+            timestamp=_now(),
+        )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await temp_backend.create_work_logs([log, log])
+
+        assert await temp_backend.get_work_logs(spec_id=sample_spec_db.id) == []
+
+    @pytest.mark.asyncio
+    async def test_iter_methods_stream_results(
+        self, temp_backend, sample_spec_db, sample_task_db
+    ):
+        """Test that the iter_* methods yield the same rows as the list methods."""
+        await temp_backend.create_specification(sample_spec_db)
+        await temp_backend.create_task(sample_task_db)
+        await temp_backend.create_work_log(
+            WorkLogDB(
+                id="log-1",
+                spec_id=sample_spec_db.id,
+                task_id=sample_task_db.id,
+                action="started",
+                timestamp=_now(),
+            )
+        )
+
+        specs = [s.id async for s in temp_backend.iter_specifications()]
+        tasks = [
+            t.id async for t in temp_backend.iter_tasks_for_spec(sample_spec_db.id)
+        ]
+        logs = [
+            log.id
+            async for log in temp_backend.iter_work_logs(spec_id=sample_spec_db.id)
+        ]
+
+        assert specs == [sample_spec_db.id]
+        assert tasks == [sample_task_db.id]
+        assert logs == ["log-1"]
+        assert temp_backend._readers.qsize() == len(temp_backend._reader_connections)
+
+    @pytest.mark.asyncio
     async def test_create_and_get_approval(
         self, temp_backend, sample_spec_db, sample_task_db
     ):
@@ -281,7 +831,7 @@ class TestSQLiteBackend:
             task_id=sample_task_db.id,
             level=ApprovalLevel.PEER,
             approved_by="reviewer",
-            approved_at=datetime.now(),
+            approved_at=_now(),
             comments="Looks good",
             override_reason=None,
         )
@@ -294,13 +844,62 @@ class TestSQLiteBackend:
         assert approvals[0].level == ApprovalLevel.PEER
         assert approvals[0].approved_by == "reviewer"
 
+    @pytest.mark.asyncio
+    async def test_create_approval_rows(
+        self, temp_backend, sample_spec_db, sample_task_db
+    ):
+        """Test bulk-inserting raw approval rows without models."""
+        await temp_backend.create_specification(sample_spec_db)
+        await temp_backend.create_task(sample_task_db)
+
+        rows = [
+            (
+                f"approval-{n}",
+                sample_task_db.id,
+                "self",
+                "dev",
+                _now(),
+                None,
+                None,
+            )
+            for n in range(3)
+        ]
+        ids = await temp_backend.create_approval_rows(rows)
+        assert ids == ["approval-0", "approval-1", "approval-2"]
+
+        approvals = await temp_backend.get_approvals_for_task(sample_task_db.id)
+        assert len(approvals) == 3
+        assert all(a.level == ApprovalLevel.SELF for a in approvals)
+
+    @pytest.mark.asyncio
+    async def test_get_spec_bundle(self, temp_backend, sample_spec_db, sample_task_db):
+        """Test fetching a specification with its tasks and work logs at once."""
+        await temp_backend.create_specification(sample_spec_db)
+        await temp_backend.create_task(sample_task_db)
+        await temp_backend.create_work_log(
+            WorkLogDB(
+                id="log-1",
+                spec_id=sample_spec_db.id,
+                task_id=sample_task_db.id,
+                action="started",
+                timestamp=_now(),
+            )
+        )
+
+        spec, tasks, logs = await temp_backend.get_spec_bundle(sample_spec_db.id)
+
+        assert spec.id == sample_spec_db.id
+        assert [task.id for task in tasks] == [sample_task_db.id]
+        assert [log.id for log in logs] == ["log-1"]
+
+    @pytest.mark.asyncio
     async def test_create_and_query_work_logs(self, temp_backend, sample_spec_db):
         """Test creating and querying work logs."""
         # Create specification
         await temp_backend.create_specification(sample_spec_db)
 
         # Create work logs
-        now = datetime.now()
+        now = _now()
         log1 = WorkLogDB(
             id="log-1",
             spec_id=sample_spec_db.id,
@@ -348,6 +947,37 @@ class TestSQLiteBackend:
         limited_logs = await temp_backend.get_work_logs(limit=1)
         assert len(limited_logs) == 1
 
+        # Next page after the newest log
+        older_logs = await temp_backend.get_work_logs(
+            limit=1, before=(limited_logs[0].timestamp, limited_logs[0].id)
+        )
+        assert [log.id for log in older_logs] == ["log-1"]
+
+    def test_list_columns_round_trip(self):
+        """Test the list column encoding, including the empty fast path."""
+        assert _dumps_list([]) == "[]"
+        assert _loads_list(_dumps_list(["a", "b"])) == ["a", "b"]
+        assert _loads_list("[]") == []
+        assert _loads_list(None) == []
+
+    def test_work_logs_sql_is_built_once_per_filter_combination(self):
+        """Test that work log queries are cached and order predicates."""
+        sql = _work_logs_sql(True, True, False, False, False, True)
+
+        assert sql is _work_logs_sql(True, True, False, False, False, True)
+        assert sql.index("task_id = ?") < sql.index("spec_id = ?")
+        assert sql.endswith("LIMIT ?")
+        assert "WHERE" not in _work_logs_sql(False, False, False, False, False, False)
+
+    def test_uuid4_batch(self):
+        """Test that batched IDs are distinct version 4 UUIDs."""
+        ids = _uuid4_batch(3)
+
+        assert len(set(ids)) == 3
+        assert all(uuid.UUID(value).version == 4 for value in ids)
+        assert _uuid4_batch(0) == []
+
+    @pytest.mark.asyncio
     async def test_transaction_context_manager(self, temp_backend, sample_spec_db):
         """Test transaction context manager."""
         # Successful transaction
@@ -362,16 +992,138 @@ class TestSQLiteBackend:
         spec2 = sample_spec_db.model_copy()
         spec2.id = "test-spec-456"
 
-        with pytest.raises(Exception):
+        async def fail_in_transaction():
             async with temp_backend.transaction():
                 await temp_backend.create_specification(spec2)
                 # Simulate error
-                raise RuntimeError("Transaction failed")
+                msg = "Transaction failed"
+                raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError, match="Transaction failed"):
+            await fail_in_transaction()
 
         # Verify rollback (spec2 should not exist)
         result = await temp_backend.get_specification("test-spec-456")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_transaction_defers_commit_of_all_writes(
+        self, temp_backend, sample_spec_db, sample_task_db
+    ):
+        """Test that writes inside a transaction are rolled back together."""
+        await temp_backend.create_specification(sample_spec_db)
+
+        async def fail_in_transaction():
+            async with temp_backend.transaction():
+                await temp_backend.create_task(sample_task_db)
+                await temp_backend.delete_specification(sample_spec_db.id)
+                msg = "Transaction failed"
+                raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError, match="Transaction failed"):
+            await fail_in_transaction()
+
+        assert await temp_backend.get_specification(sample_spec_db.id) is not None
+        assert await temp_backend.get_task(sample_task_db.id) is None
+
+    @pytest.mark.asyncio
+    async def test_nested_transaction_joins_outer(self, temp_backend, sample_spec_db):
+        """Test that a nested transaction commits with the outer one."""
+        async with temp_backend.transaction():
+            async with temp_backend.transaction():
+                await temp_backend.create_specification(sample_spec_db)
+            assert temp_backend.connection.in_transaction
+
+        assert not temp_backend.connection.in_transaction
+        assert await temp_backend.get_specification(sample_spec_db.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_nested_transaction_rolls_back_only_itself(
+        self, temp_backend, sample_spec_db
+    ):
+        """Test that a nested transaction is undone as a savepoint."""
+        other = sample_spec_db.model_copy()
+        other.id = "test-spec-456"
+
+        async def fail_in_savepoint():
+            async with temp_backend.transaction():
+                await temp_backend.create_specification(other)
+                msg = "boom"
+                raise DatabaseError(msg)
+
+        async with temp_backend.transaction():
+            await temp_backend.create_specification(sample_spec_db)
+            with pytest.raises(DatabaseError, match="boom"):
+                await fail_in_savepoint()
+
+        assert await temp_backend.get_specification(sample_spec_db.id) is not None
+        assert await temp_backend.get_specification(other.id) is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_transaction_rolls_back(self, temp_backend, sample_spec_db):
+        """Test that cancelling a task inside a transaction undoes its writes."""
+        written = asyncio.Event()
+
+        async def write_then_wait():
+            async with temp_backend.transaction():
+                await temp_backend.create_specification(sample_spec_db)
+                written.set()
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(write_then_wait())
+        await written.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert not temp_backend.connection.in_transaction
+        assert await temp_backend.get_specification(sample_spec_db.id) is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_transactions_do_not_nest(
+        self, temp_backend, sample_spec_db
+    ):
+        """Test that a failing task's transaction does not undo another's."""
+        other = sample_spec_db.model_copy()
+        other.id = "test-spec-456"
+        entered = asyncio.Event()
+
+        async def failing():
+            async with temp_backend.transaction():
+                await temp_backend.create_specification(other)
+                entered.set()
+                await asyncio.sleep(0)
+                msg = "boom"
+                raise DatabaseError(msg)
+
+        async def succeeding():
+            await entered.wait()
+            async with temp_backend.transaction():
+                await temp_backend.create_specification(sample_spec_db)
+
+        results = await asyncio.gather(failing(), succeeding(), return_exceptions=True)
+
+        assert isinstance(results[0], DatabaseError)
+        assert results[1] is None
+        assert temp_backend._in_txn == 0
+        assert not temp_backend.connection.in_transaction
+        assert await temp_backend.get_specification(sample_spec_db.id) is not None
+        assert await temp_backend.get_specification(other.id) is None
+
+    @pytest.mark.asyncio
+    async def test_write_outside_transaction_is_committed(
+        self, temp_backend, sample_spec_db
+    ):
+        """Test that a standalone write is visible to the reader pool."""
+        await temp_backend.create_specification(sample_spec_db)
+
+        assert not temp_backend.connection.in_transaction
+        async with temp_backend._acquire_reader() as conn:
+            assert conn is not temp_backend.connection
+            async with conn.execute("SELECT COUNT(*) FROM specifications") as cursor:
+                assert (await cursor.fetchone())[0] == 1
+
+    @pytest.mark.asyncio
     async def test_database_not_initialized_error(self):
         """Test operations fail when database not initialized."""
         backend = SQLiteBackend("test.db")
@@ -382,8 +1134,8 @@ class TestSQLiteBackend:
                     id="test",
                     title="test",
                     inherits=[],
-                    created=datetime.now(),
-                    updated=datetime.now(),
+                    created=_now(),
+                    updated=_now(),
                     version="1.0",
                     status=SpecStatus.DRAFT,
                     context={},
@@ -391,18 +1143,18 @@ class TestSQLiteBackend:
                 )
             )
 
+    @pytest.mark.asyncio
     async def test_missing_aiosqlite_dependency(self):
         """Test error when aiosqlite is not available."""
         backend = SQLiteBackend("test.db")
 
         # Mock the import to fail
-        import builtins
-
         original_import = builtins.__import__
 
         def mock_import(name, *args, **kwargs):
             if name == "aiosqlite":
-                raise ImportError("No module named 'aiosqlite'")
+                msg = "No module named 'aiosqlite'"
+                raise ImportError(msg)
             return original_import(name, *args, **kwargs)
 
         builtins.__import__ = mock_import
@@ -413,14 +1165,17 @@ class TestSQLiteBackend:
         finally:
             builtins.__import__ = original_import
 
+    @pytest.mark.asyncio
     async def test_close_connection(self, temp_backend):
         """Test closing database connection."""
         # Verify connection exists
-        assert temp_backend.connection is not None
+        assert temp_backend.is_initialized
 
         # Close connection
         await temp_backend.close()
-        assert temp_backend.connection is None
+        assert not temp_backend.is_initialized
+        with pytest.raises(DatabaseError, match="Database not initialized"):
+            temp_backend.connection  # noqa: B018
 
 
 class TestAsyncSpecManager:
@@ -433,7 +1188,7 @@ class TestAsyncSpecManager:
             id="manager-test-123",
             title="Manager Test Spec",
             inherits=[],
-            created=datetime.now().isoformat(),
+            created=_now().isoformat(),
             version="1.0",
             status="draft",
         )
@@ -468,6 +1223,28 @@ class TestAsyncSpecManager:
             implementation=implementation,
         )
 
+    def test_calculate_completion_percentage(self, sample_programming_spec):
+        """Test that completed and approved steps count as done."""
+        done = sample_programming_spec.implementation[0]
+        done.progress = TaskProgress(status=TaskStatus.APPROVED)
+        pending = done.model_copy(update={"progress": None, "step_id": None})
+        sample_programming_spec.implementation.append(pending)
+
+        percentage = AsyncSpecManager._calculate_completion_percentage(
+            sample_programming_spec
+        )
+
+        assert percentage == 50.0
+
+    def test_derive_tracking(self, sample_programming_spec):
+        """Test deriving workflow status, completion flag and percentage."""
+        sample_programming_spec.metadata.status = "implemented"
+
+        tracking = AsyncSpecManager._derive_tracking(sample_programming_spec)
+
+        assert tracking == (WorkflowStatus.COMPLETED, True, 0.0)
+
+    @pytest.mark.asyncio
     async def test_async_context_manager(self):
         """Test AsyncSpecManager as async context manager."""
         temp_dir = tempfile.mkdtemp()
@@ -475,13 +1252,26 @@ class TestAsyncSpecManager:
             backend = SQLiteBackend(Path(temp_dir) / "test.db")
 
             async with AsyncSpecManager(backend) as manager:
-                assert manager.backend.connection is not None
+                assert manager.backend.is_initialized
 
             # Connection should be closed after exiting context
-            assert manager.backend.connection is None
+            assert not manager.backend.is_initialized
         finally:
             shutil.rmtree(temp_dir)
 
+    @pytest.mark.asyncio
+    async def test_context_manager_leaves_open_backend_open(self, tmp_path):
+        """Test that a manager does not close a backend it did not open."""
+        backend = SQLiteBackend(tmp_path / "test.db")
+        await backend.initialize()
+        try:
+            async with AsyncSpecManager(backend):
+                pass
+            assert backend.is_initialized
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
     async def test_save_spec_to_db(self, sample_programming_spec):
         """Test saving ProgrammingSpec to database."""
         temp_dir = tempfile.mkdtemp()
@@ -505,17 +1295,118 @@ class TestAsyncSpecManager:
         finally:
             shutil.rmtree(temp_dir)
 
+    @pytest.mark.asyncio
+    async def test_save_spec_to_db_uses_one_timestamp(
+        self, tmp_path, sample_programming_spec
+    ):
+        """Test that defaulted created and updated share the save time."""
+        sample_programming_spec.metadata.created = "not a date"
+        backend = SQLiteBackend(tmp_path / "test.db")
+
+        async with AsyncSpecManager(backend) as manager:
+            spec_id = await manager.save_spec_to_db(sample_programming_spec)
+            saved = await backend.get_specification(spec_id)
+
+        assert saved.created == saved.updated
+
+    @pytest.mark.asyncio
+    async def test_save_spec_to_db_twice_updates_tasks(
+        self, tmp_path, sample_programming_spec
+    ):
+        """Test that saving a spec again updates its tasks in place."""
+        backend = SQLiteBackend(tmp_path / "test.db")
+
+        async with AsyncSpecManager(backend) as manager:
+            await manager.save_spec_to_db(sample_programming_spec)
+            sample_programming_spec.implementation[0].task = "Revised feature"
+            await manager.save_spec_to_db(sample_programming_spec)
+
+            tasks = await backend.get_tasks_for_spec(
+                sample_programming_spec.metadata.id
+            )
+            assert [t.task for t in tasks] == ["Revised feature"]
+
+    @pytest.mark.asyncio
+    async def test_save_spec_to_db_is_atomic(self, tmp_path, sample_programming_spec):
+        """Test that a failed write leaves nothing of the spec behind."""
+        backend = SQLiteBackend(tmp_path / "test.db")
+
+        async with AsyncSpecManager(backend) as manager:
+            backend.upsert_tasks = AsyncMock(side_effect=DatabaseError("boom"))
+            with pytest.raises(DatabaseError, match="boom"):
+                await manager.save_spec_to_db(sample_programming_spec)
+
+            spec_id = sample_programming_spec.metadata.id
+            assert await backend.get_specification(spec_id) is None
+
+    @pytest.mark.asyncio
+    async def test_save_spec_to_db_spec_insert_failure_propagates(
+        self, tmp_path, sample_programming_spec
+    ):
+        """Test that a failed specification insert is raised, not swallowed."""
+        backend = SQLiteBackend(tmp_path / "test.db")
+
+        async with AsyncSpecManager(backend) as manager:
+            backend.create_specification = AsyncMock(side_effect=DatabaseError("boom"))
+            backend.upsert_tasks = AsyncMock()
+            with pytest.raises(DatabaseError, match="boom"):
+                await manager.save_spec_to_db(sample_programming_spec)
+
+            backend.upsert_tasks.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_spec_to_db_work_log_failure_rolls_back(
+        self, tmp_path, sample_programming_spec
+    ):
+        """Test that a failed work log write surfaces as-is and undoes the tasks."""
+        sample_programming_spec.work_logs = [
+            WorkLogEntry(
+                spec_id=sample_programming_spec.metadata.id,
+                step_id="manager-test-123:0",
+                action="started",
+                timestamp=_now(),
+            )
+        ]
+        backend = SQLiteBackend(tmp_path / "test.db")
+
+        async with AsyncSpecManager(backend) as manager:
+            backend.create_work_logs = AsyncMock(side_effect=DatabaseError("boom"))
+            with pytest.raises(DatabaseError, match="boom"):
+                await manager.save_spec_to_db(sample_programming_spec)
+
+            spec_id = sample_programming_spec.metadata.id
+            assert await backend.get_tasks_for_spec(spec_id) == []
+
+    @pytest.mark.asyncio
+    async def test_manager_transaction_rolls_back_all_saves(
+        self, tmp_path, sample_programming_spec
+    ):
+        """Test that saves grouped in a manager transaction are undone together."""
+        backend = SQLiteBackend(tmp_path / "test.db")
+
+        async with AsyncSpecManager(backend) as manager:
+
+            async def fail_after_save():
+                async with manager.transaction():
+                    await manager.save_spec_to_db(sample_programming_spec)
+                    raise RuntimeError
+
+            with pytest.raises(RuntimeError):
+                await fail_after_save()
+
+            spec_id = sample_programming_spec.metadata.id
+            assert not await manager.specification_exists(spec_id)
+
+    @pytest.mark.asyncio
     async def test_save_spec_with_work_logs(self, sample_programming_spec):
         """Test saving spec with work logs."""
         # Add work logs to spec
-        from agentic_spec.models import WorkLogEntry
-
         sample_programming_spec.work_logs = [
             WorkLogEntry(
                 spec_id=sample_programming_spec.metadata.id,
                 step_id="manager-test-123:0",
                 action="started",
-                timestamp=datetime.now(),
+                timestamp=_now(),
                 notes="Beginning work",
             )
         ]
@@ -536,3 +1427,34 @@ class TestAsyncSpecManager:
 
         finally:
             shutil.rmtree(temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_save_spec_with_approvals_and_work_logs(
+        self, tmp_path, sample_programming_spec
+    ):
+        """Test that approvals and work logs are both saved in one call."""
+        spec_id = sample_programming_spec.metadata.id
+        sample_programming_spec.implementation[0].approvals = [
+            ApprovalRecord(
+                level=ApprovalLevel.SELF,
+                approved_by="tester",
+                approved_at=_now(),
+            )
+        ]
+        sample_programming_spec.work_logs = [
+            WorkLogEntry(
+                spec_id=spec_id,
+                step_id="manager-test-123:0",
+                action="completed",
+                timestamp=_now(),
+            )
+        ]
+        backend = SQLiteBackend(tmp_path / "test.db")
+
+        async with AsyncSpecManager(backend) as manager:
+            await manager.save_spec_to_db(sample_programming_spec)
+
+            approvals = await backend.get_approvals_for_task("manager-test-123:0")
+            logs = await backend.get_work_logs(spec_id=spec_id)
+            assert [a.approved_by for a in approvals] == ["tester"]
+            assert [log.action for log in logs] == ["completed"]
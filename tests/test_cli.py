@@ -1,5 +1,6 @@
 """Tests for the Typer-based CLI functionality."""
 
+import asyncio
 from pathlib import Path
 import tempfile
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -7,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from typer.testing import CliRunner
 
+from agentic_spec.async_db import AsyncSpecManager
 from agentic_spec.cli import app
 from agentic_spec.exceptions import (
     ConfigurationError,
@@ -97,7 +99,9 @@ class TestGenerateCommand:
         mock_spec = MagicMock()
         mock_spec.metadata.id = "test123"
         mock_generator.generate_spec = AsyncMock(return_value=mock_spec)
-        mock_generator.save_spec.return_value = specs_dir / "test-spec.yaml"
+        mock_generator.save_spec_async = AsyncMock(
+            return_value=specs_dir / "test-spec.yaml"
+        )
 
         mock_init_gen.return_value = mock_generator
         mock_get_prompt.return_value = "test prompt"
@@ -164,7 +168,9 @@ class TestGenerateCommand:
         mock_spec = MagicMock()
         mock_spec.metadata.id = "test123"
         mock_generator.generate_spec = AsyncMock(return_value=mock_spec)
-        mock_generator.save_spec.return_value = specs_dir / "test-spec.yaml"
+        mock_generator.save_spec_async = AsyncMock(
+            return_value=specs_dir / "test-spec.yaml"
+        )
 
         mock_init_gen.return_value = mock_generator
         mock_get_prompt.return_value = "test prompt"
@@ -190,6 +196,53 @@ class TestGenerateCommand:
         call_args = mock_generator.generate_spec.call_args
         assert call_args[0][1] == ["template1", "template2"]  # inherits argument
 
+    @patch("agentic_spec.cli_core.initialize_generator")
+    @patch("agentic_spec.cli_core.get_prompt_input")
+    def test_generate_file_error_cancels_database_save(
+        self, mock_get_prompt, mock_init_gen, cli_runner, temp_dirs
+    ):
+        """Test that a failed file write cancels the concurrent database save."""
+        templates_dir, specs_dir = temp_dirs
+
+        mock_generator = MagicMock()
+        mock_generator.config.default_context.user_role = "developer"
+        mock_generator.config.default_context.target_audience = "team"
+        mock_generator.config.default_context.desired_tone = "professional"
+        mock_generator.config.default_context.complexity_level = "intermediate"
+        mock_generator.config.default_context.time_constraints = "moderate"
+        mock_generator.config.workflow.auto_review = False
+        mock_generator.config.workflow.collect_feedback = False
+        mock_spec = MagicMock()
+        mock_generator.generate_spec = AsyncMock(return_value=mock_spec)
+        mock_generator.save_spec_async = AsyncMock(side_effect=OSError("disk full"))
+        mock_init_gen.return_value = mock_generator
+        mock_get_prompt.return_value = "test prompt"
+
+        cancelled = []
+
+        async def slow_save(manager, spec):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(spec)
+                raise
+
+        with patch.object(AsyncSpecManager, "save_spec_to_db", slow_save):
+            result = cli_runner.invoke(
+                app,
+                [
+                    "generate",
+                    "test prompt",
+                    "--templates-dir",
+                    str(templates_dir),
+                    "--specs-dir",
+                    str(specs_dir),
+                ],
+            )
+
+        assert result.exit_code == 1
+        assert cancelled == [mock_spec]
+
 
 class TestReviewCommand:
     """Test the review command functionality."""
@@ -280,7 +333,9 @@ class TestExpandCommand:
 
         mock_generator.find_spec_by_id.return_value = mock_parent_spec
         mock_generator.expand_step = AsyncMock(return_value=mock_sub_spec)
-        mock_generator.save_spec.return_value = specs_dir / "sub-spec.yaml"
+        mock_generator.save_spec_async = AsyncMock(
+            return_value=specs_dir / "sub-spec.yaml"
+        )
 
         mock_init_gen.return_value = mock_generator
 
@@ -128,7 +128,7 @@ class TestPromptInputHandling:
         """Test that empty prompt raises ValidationError."""
         with (
             patch("sys.stdin.isatty", return_value=True),
-            patch("builtins.input", side_effect=EOFError),
+            patch("sys.stdin.read", return_value=""),
             pytest.raises(ValidationError, match="No prompt provided"),
         ):
             get_prompt_input(None)
@@ -137,7 +137,7 @@ class TestPromptInputHandling:
         """Test handling of keyboard interrupt during interactive input."""
         with (
             patch("sys.stdin.isatty", return_value=True),
-            patch("builtins.input", side_effect=KeyboardInterrupt),
+            patch("sys.stdin.read", side_effect=KeyboardInterrupt),
             pytest.raises(SystemExit),
         ):
             get_prompt_input(None)
@@ -0,0 +1,32 @@
+"""Tests for the JSON codec used by the database and AI response parsing."""
+
+import pytest
+
+from agentic_spec.utils.json_codec import json_dumps, json_dumps_pretty, json_loads
+
+
+class TestJsonCodec:
+    """Test JSON encoding and decoding with whichever accelerator is installed."""
+
+    def test_round_trip(self):
+        """Test that encoded values decode back unchanged."""
+        value = {"title": "Spec ✓", "tags": ["a", "b"], "count": 3, "done": None}
+
+        encoded = json_dumps(value)
+
+        assert isinstance(encoded, str)
+        assert json_loads(encoded) == value
+
+    def test_malformed_input_raises_value_error(self):
+        """Test that every backend reports bad JSON as a ValueError."""
+        with pytest.raises(ValueError):
+            json_loads("{not json")
+
+    def test_pretty_output_is_indented(self):
+        """Test that the display encoder indents by two spaces and round-trips."""
+        value = {"ai_settings": {"default_provider": "openai"}, "tags": []}
+
+        encoded = json_dumps_pretty(value)
+
+        assert '\n  "ai_settings": {\n    "default_provider"' in encoded
+        assert json_loads(encoded) == value